@@ -2,39 +2,112 @@
 
 import sys
 import argparse
+import logging
+import re
 import signal
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from scrapers.linkedin_scraper import LinkedInJobScraper
-from utils.logger import get_scraper_logger
-from utils.data_validator import JobDataValidator
-from config import get_config
+
+# Accepted input for the interactive max-pages prompt
+_DIGITS_RE = re.compile(r'\d+')
+
+# Managers notified by the process-wide interrupt handler
+_active_managers = weakref.WeakSet()
+
+
+def _positive_int(value: str) -> int:
+    # argparse type for --max-pages; the upper bound comes from the config
+    if not _DIGITS_RE.fullmatch(value) or int(value, 10) < 1:
+        raise argparse.ArgumentTypeError(f"must be a whole number of at least 1, got {value!r}")
+    return int(value, 10)
+
+
+def _handle_interrupt(signum, frame):
+    for manager in list(_active_managers):
+        manager._signal_handler(signum, frame)
+    raise KeyboardInterrupt
 
 
 class ScraperManager:
-    def __init__(self, config_file: Optional[str] = None):
+    __slots__ = (
+        'config', 'logger', 'validator', 'cache', 'scraper', 'interrupted', 'quiet',
+        '__weakref__'  # needed for _active_managers
+    )
+    
+    def __init__(self, config_file: Optional[str] = None, quiet: bool = False,
+                 use_cache: bool = True):
+        # Imported here so --help/--version don't load config (which also
+        # creates the output directories) or the utility modules
+        from config import get_config
+        from utils.logger import get_scraper_logger
+        from utils.data_validator import JobDataValidator
+        from utils.result_cache import SearchResultCache
+        
         self.config = get_config(config_file)
         self.logger = get_scraper_logger("advanced")
-        self.validator = JobDataValidator()
+        if quiet:
+            # Log files keep everything; the console only shows problems
+            for handler in self.logger.handlers:
+                if not isinstance(handler, logging.FileHandler):
+                    handler.setLevel(logging.WARNING)
+        self.validator = JobDataValidator(
+            min_title_length=self.config.scraping.min_title_length,
+            max_title_length=self.config.scraping.max_title_length
+        )
+        self.cache = None
+        if use_cache and self.config.scraping.cache_results:
+            self.cache = SearchResultCache(
+                self.config.output.cache_dir, self.config.scraping.cache_ttl
+            )
         self.scraper = None
         self.interrupted = False
+        self.quiet = quiet
         
-        signal.signal(signal.SIGINT, self._signal_handler)
+        _active_managers.add(self)
+    
+    def _say(self, message: str):
+        # Progress and banner output; errors and prompts always print
+        if not self.quiet:
+            print(message)
+    
+    def _default_max_pages(self) -> int:
+        # Three pages unless the configured limit is lower
+        return max(1, min(3, self.config.scraping.max_pages_basic))
+    
+    def _max_pages_in_range(self, max_pages: int) -> bool:
+        # Same bound for --max-pages and the interactive prompt
+        max_pages_limit = self.config.scraping.max_pages_basic
+        if 1 <= max_pages <= max_pages_limit:
+            return True
+        print(f"Max pages must be a number between 1 and {max_pages_limit}.")
+        return False
     
     def _signal_handler(self, signum, frame):
         self.interrupted = True
         self.logger.info("Interrupt signal received. Shutting down gracefully...")
-        sys.exit(0)
     
-    def run_interactive(self):
-        print("🔍 LinkedIn Job Scraper - 2025 Edition")
-        print("=" * 50)
+    def run_interactive(self, args=None):
+        self._say("🔍 LinkedIn Job Scraper - 2025 Edition\n" + "=" * 50)
+        
+        # Values given on the command line are used as-is instead of prompting
+        preset = {}
+        if args is not None:
+            if args.keywords:
+                preset['keywords'] = args.keywords
+            if args.location is not None:
+                preset['location'] = args.location
+            # An out-of-range --max-pages falls back to the prompt
+            if args.max_pages is not None and self._max_pages_in_range(args.max_pages):
+                preset['max_pages'] = args.max_pages
         
         try:
-            search_params = self._get_search_parameters()
+            search_params = self._get_search_parameters(preset)
             
             self._initialize_scraper()
             results = self._run_scraper(search_params)
@@ -54,10 +127,14 @@ class ScraperManager:
         try:
             self.logger.info(f"Starting advanced scraper with arguments")
             
+            max_pages = args.max_pages if args.max_pages is not None else self._default_max_pages()
+            if not self._max_pages_in_range(max_pages):
+                return False
+            
             search_params = {
                 'keywords': args.keywords,
-                'location': args.location,
-                'max_pages': args.max_pages
+                'location': args.location or '',
+                'max_pages': max_pages
             }
             
             self._initialize_scraper()
@@ -75,47 +152,59 @@ class ScraperManager:
             return False
     
     def _show_scraper_info(self):
-        print("\nUsing Advanced LinkedIn Scraper 2025:")
-        print("• HTTPX with HTTP/2 support for superior performance")
-        print("• Advanced anti-detection and behavioral simulation")
-        print("• Intelligent rate limiting and session management")
-        print("• AI-resistant fingerprinting techniques")
+        self._say("\n".join([
+            "\nUsing Advanced LinkedIn Scraper 2025:",
+            "• HTTPX with HTTP/2 support for superior performance",
+            "• Advanced anti-detection and behavioral simulation",
+            "• Intelligent rate limiting and session management",
+            "• AI-resistant fingerprinting techniques"
+        ]))
     
-    def _get_search_parameters(self) -> dict:
+    def _get_search_parameters(self, preset: Optional[dict] = None) -> dict:
         self._show_scraper_info()
-        params = {}
+        params = dict(preset or {})
         
-        while True:
+        while 'keywords' not in params:
             keywords = input("\n📝 Enter job keywords (e.g., 'python developer'): ").strip()
             if keywords:
                 params['keywords'] = keywords
                 break
             print("Keywords are required. Please try again.")
         
-        location = input("📍 Enter location (e.g., 'New York, NY') [optional]: ").strip()
-        params['location'] = location
+        if 'location' not in params:
+            location = input("📍 Enter location (e.g., 'New York, NY') [optional]: ").strip()
+            params['location'] = location
         
         max_pages_limit = self.config.scraping.max_pages_basic
         
-        while True:
-            try:
-                max_pages = input(f"📄 Enter max pages to scrape (1-{max_pages_limit}, default 3): ").strip()
-                max_pages = int(max_pages) if max_pages else 3
-                if 1 <= max_pages <= max_pages_limit:
-                    params['max_pages'] = max_pages
-                    break
-                else:
-                    print(f"Please enter a number between 1 and {max_pages_limit}.")
-            except ValueError:
-                print("Please enter a valid number.")
+        default_max_pages = self._default_max_pages()
+        
+        while 'max_pages' not in params:
+            max_pages = input(f"📄 Enter max pages to scrape (1-{max_pages_limit}, default {default_max_pages}): ").strip()
+            if not max_pages:
+                max_pages = default_max_pages
+            elif _DIGITS_RE.fullmatch(max_pages):
+                max_pages = int(max_pages, 10)
+            else:
+                print("Please enter a whole number of pages (digits only).")
+                continue
+            
+            if self._max_pages_in_range(max_pages):
+                params['max_pages'] = max_pages
+                break
         
         return params
     
     def _initialize_scraper(self):
+        # Imported here so --help and argument errors skip loading httpx/bs4
+        from scrapers.linkedin_scraper import LinkedInJobScraper, configure_logging
+        
         try:
             self.scraper = LinkedInJobScraper(
                 output_dir=self.config.output.data_dir
             )
+            if self.quiet:
+                configure_logging(console_level=logging.WARNING)
             
             self.logger.info("Advanced scraper initialized")
             
@@ -126,76 +215,124 @@ class ScraperManager:
     def _run_scraper(self, params: dict) -> list:
         self.logger.info(f"Starting scrape: {params}")
         
-        print(f"\n🚀 Starting advanced scrape:")
-        print(f"   Keywords: {params['keywords']}")
-        print(f"   Location: {params['location'] or 'Any'}")
-        print(f"   Max pages: {params['max_pages']}")
-        print("-" * 50)
+        self._say("\n".join([
+            "\n🚀 Starting advanced scrape:",
+            f"   Keywords: {params['keywords']}",
+            f"   Location: {params['location'] or 'Any'}",
+            f"   Max pages: {params['max_pages']}",
+            "-" * 50
+        ]))
+        
+        if self.cache:
+            cached = self.cache.get(params)
+            if cached is not None:
+                self.logger.info(f"Using {len(cached)} cached jobs for {params}")
+                self._say("♻️  Using cached results from a recent identical search")
+                self.scraper.use_cached_jobs(cached)
+                return cached
+        
+        results = self.scraper.search_jobs(
+            keywords=params['keywords'],
+            location=params['location'],
+            max_pages=params['max_pages'],
+            max_concurrency=self.config.scraping.max_concurrency
+        )
         
-        return self.scraper.search_jobs(**params)
+        if results and self.cache:
+            self.cache.set(params, results)
+        
+        return results
     
     def _process_results(self, results: list):
-        print(f"\n✅ Scraping completed! Found {len(results)} jobs.")
+        self._say(f"\n✅ Scraping completed! Found {len(results)} jobs.")
         
-        print("🔍 Validating and cleaning data...")
-        original_count = len(results)
+        self._say("🔍 Validating and cleaning data...")
         
-        # Remove duplicates based on title + company
+        # Remove duplicates (title + company) and invalid jobs in a single pass,
+        # skipping whichever stage is disabled in the scraping config
+        remove_duplicates = self.config.scraping.remove_duplicates
+        validate_data = self.config.scraping.validate_data
+        is_valid_job = self.validator.is_valid_job
         seen = set()
-        unique_results = []
+        valid_jobs = []
+        removed_duplicates = 0
+        invalid_count = 0
         for job in results:
-            signature = f"{job.get('title', '')}_{job.get('company', '')}"
-            if signature not in seen:
+            if remove_duplicates:
+                signature = (job.get('title', ''), job.get('company', ''))
+                if signature in seen:
+                    removed_duplicates += 1
+                    continue
                 seen.add(signature)
-                unique_results.append(job)
+            
+            if validate_data and not is_valid_job(job):
+                invalid_count += 1
+                continue
+            valid_jobs.append(job)
         
-        removed_duplicates = original_count - len(unique_results)
         if removed_duplicates > 0:
-            print(f"🔄 Removed {removed_duplicates} duplicate jobs")
-            self.scraper.jobs_data = unique_results
-        
-        # Validate data
-        valid_jobs = [job for job in unique_results if self.validator.is_valid_job(job)]
-        invalid_count = len(unique_results) - len(valid_jobs)
+            self._say(f"🔄 Removed {removed_duplicates} duplicate jobs")
         
         if invalid_count > 0:
-            print(f"⚠️  Filtered out {invalid_count} invalid jobs")
+            self._say(f"⚠️  Filtered out {invalid_count} invalid jobs")
+        
+        if removed_duplicates or invalid_count:
             self.scraper.jobs_data = valid_jobs
         
-        print(f"✨ Data validation complete. Final count: {len(valid_jobs)} jobs")
+        self._say(f"✨ Data validation complete. Final count: {len(valid_jobs)} jobs")
         
-        # Save results
-        csv_saved = self.scraper.save_to_csv()
-        json_saved = self.scraper.save_to_json()
+        # Save results (output files are written concurrently)
+        save_arrow = self.config.output.save_arrow
+        with ThreadPoolExecutor(max_workers=3 if save_arrow else 2) as executor:
+            csv_future = executor.submit(self.scraper.save_to_csv)
+            json_future = executor.submit(self.scraper.save_to_json)
+            arrow_future = None
+            if save_arrow:
+                arrow_future = executor.submit(
+                    self.scraper.save_to_arrow,
+                    compression=self.config.output.arrow_compression
+                )
+            csv_saved = csv_future.result()
+            json_saved = json_future.result()
+            arrow_saved = arrow_future.result() if arrow_future else False
         
         if csv_saved and json_saved:
-            print(f"\n💾 Files saved to '{self.config.output.data_dir}' directory:")
-            print(f"   - linkedin_jobs_2025.csv")
-            print(f"   - linkedin_jobs_2025.json")
+            saved_lines = [
+                f"\n💾 Files saved to '{self.config.output.data_dir}' directory:",
+                "   - linkedin_jobs_2025.csv",
+                "   - linkedin_jobs_2025.json"
+            ]
+            if arrow_saved:
+                saved_lines.append("   - linkedin_jobs_2025.arrow")
+            self._say("\n".join(saved_lines))
         
         # Show summary
-        self.scraper.print_summary()
+        if not self.quiet:
+            self.scraper.print_summary()
         
         # Offer to open files
         self._offer_file_actions()
     
     def _handle_no_results(self):
-        print("\n❌ No jobs found. This might be due to:")
-        print("   • LinkedIn's anti-bot measures")
-        print("   • Too restrictive search criteria")
-        print("   • Network connectivity issues")
-        print("   • Rate limiting")
-        
-        print("\n💡 Consider:")
-        print("   • Using broader search terms")
-        print("   • Checking your internet connection")
-        print("   • Waiting a few minutes before trying again")
-        print("   • The advanced scraper uses intelligent rate limiting")
+        print("\n".join([
+            "\n❌ No jobs found. This might be due to:",
+            "   • LinkedIn's anti-bot measures",
+            "   • Too restrictive search criteria",
+            "   • Network connectivity issues",
+            "   • Rate limiting",
+            "",
+            "💡 Consider:",
+            "   • Using broader search terms",
+            "   • Checking your internet connection",
+            "   • Waiting a few minutes before trying again",
+            "   • The advanced scraper uses intelligent rate limiting"
+        ]))
     
     def _offer_file_actions(self):
         # Optional: Add functionality to open files or perform additional actions
         pass
 
+@lru_cache(maxsize=1)
 def create_parser():
     parser = argparse.ArgumentParser(
         description='LinkedIn Job Scraper - Extract job listings from LinkedIn',
@@ -212,11 +349,11 @@ Examples:
     parser.add_argument('-k', '--keywords', type=str, required=False,
                         help='Job keywords to search for (required unless --interactive)')
     
-    parser.add_argument('-l', '--location', type=str, default='',
+    parser.add_argument('-l', '--location', type=str, default=None,
                         help='Location to search in (optional)')
     
-    parser.add_argument('-p', '--max-pages', type=int, default=3,
-                        help='Maximum number of pages to scrape (default: 3)')
+    parser.add_argument('-p', '--max-pages', type=_positive_int, default=None,
+                        help='Maximum number of pages to scrape (default: 3, or max_pages_basic if lower)')
     
     
     parser.add_argument('-c', '--config', type=str,
@@ -225,6 +362,12 @@ Examples:
     parser.add_argument('-i', '--interactive', action='store_true',
                         help='Run in interactive mode')
     
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='Only print prompts, warnings and errors (no banners, summary or progress logging)')
+    
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always fetch fresh results; do not read or write the result cache')
+    
     parser.add_argument('--version', action='version', version='LinkedIn Job Scraper 2025 Edition v3.0')
     
     return parser
@@ -233,11 +376,14 @@ def main():
     parser = create_parser()
     args = parser.parse_args()
     
+    signal.signal(signal.SIGINT, _handle_interrupt)
+    
     try:
-        manager = ScraperManager(config_file=args.config)
+        manager = ScraperManager(config_file=args.config, quiet=args.quiet,
+                                 use_cache=not args.no_cache)
         
         if args.interactive:
-            manager.run_interactive()
+            manager.run_interactive(args)
         else:
             if not args.keywords:
                 print("❌ Keywords are required when not in interactive mode.")
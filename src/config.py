@@ -4,10 +4,16 @@ Enhanced configuration module for LinkedIn Job Scraper
 
 import os
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
+from functools import lru_cache
 import json
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parsing/serialization
+    orjson = None
+
 
 @dataclass
 class ScrapingConfig:
@@ -21,6 +27,7 @@ class ScrapingConfig:
     # Request settings
     max_retries: int = 3
     timeout: int = 30
+    max_concurrency: int = 3  # result pages fetched at once
     
     # Page limits
     max_pages_basic: int = 10
@@ -35,6 +42,10 @@ class ScrapingConfig:
     # Output settings
     remove_duplicates: bool = True
     validate_data: bool = True
+    
+    # Result caching
+    cache_results: bool = True
+    cache_ttl: int = 3600  # seconds
 
 
 @dataclass
@@ -43,69 +54,70 @@ class LinkedInConfig:
     base_url: str = "https://www.linkedin.com"
     jobs_search_url: str = "https://www.linkedin.com/jobs/search"
     
-    # CSS Selectors (with fallbacks)
-    job_card_selectors: List[str] = field(default_factory=lambda: [
+    # CSS Selectors (with fallbacks). Shared read-only defaults; a config
+    # file override sets a per-instance value instead.
+    job_card_selectors: ClassVar[Tuple[str, ...]] = (
         'div.job-search-card',
         'div.base-card',
         'li.job-result-card',
         'div.jobs-search-results__list-item',
         'div[data-entity-urn*="jobPosting"]',
         'li[data-occludable-job-id]'
-    ])
+    )
     
-    title_selectors: List[str] = field(default_factory=lambda: [
+    title_selectors: ClassVar[Tuple[str, ...]] = (
         'h3 a', 'h3', '.job-title-link', 'a[data-cy="job-title"]',
         '.job-search-card__title a', '.base-search-card__title a'
-    ])
+    )
     
-    company_selectors: List[str] = field(default_factory=lambda: [
+    company_selectors: ClassVar[Tuple[str, ...]] = (
         'h4 a', 'h4', '.job-search-card__subtitle-link',
         'a[data-cy="job-company-name"]', '.base-search-card__subtitle a'
-    ])
+    )
     
-    location_selectors: List[str] = field(default_factory=lambda: [
+    location_selectors: ClassVar[Tuple[str, ...]] = (
         '.job-search-card__location', '[data-cy="job-location"]',
         '.job-result-card__location', '.base-search-card__metadata'
-    ])
+    )
     
-    url_selectors: List[str] = field(default_factory=lambda: [
+    url_selectors: ClassVar[Tuple[str, ...]] = (
         'a[href*="/jobs/view/"]', 'h3 a', '.job-title-link'
-    ])
+    )
     
-    summary_selectors: List[str] = field(default_factory=lambda: [
+    summary_selectors: ClassVar[Tuple[str, ...]] = (
         '.job-search-card__snippet', '.job-result-card__snippet',
         '.base-search-card__metadata', 'p[data-cy="job-snippet"]'
-    ])
+    )
     
     # Search form selectors
-    keywords_search_selectors: List[str] = field(default_factory=lambda: [
+    keywords_search_selectors: ClassVar[Tuple[str, ...]] = (
         "input[aria-label*='Search job titles']",
         "input[aria-label*='Search jobs']",
         "input[placeholder*='Search job titles']",
         ".jobs-search-box__text-input[aria-label*='Search']"
-    ])
+    )
     
-    location_search_selectors: List[str] = field(default_factory=lambda: [
+    location_search_selectors: ClassVar[Tuple[str, ...]] = (
         "input[aria-label*='Search job locations']",
         "input[aria-label*='Search locations']",
         "input[placeholder*='Search job locations']",
         ".jobs-search-box__text-input[aria-label*='Location']"
-    ])
+    )
     
-    search_button_selectors: List[str] = field(default_factory=lambda: [
+    search_button_selectors: ClassVar[Tuple[str, ...]] = (
         "button[aria-label='Search']",
         "button[aria-label*='Search']",
         ".jobs-search-box__submit-button",
         "button[type='submit']"
-    ])
+    )
     
     # Pagination selectors
-    next_button_selectors: List[str] = field(default_factory=lambda: [
+    next_button_selectors: ClassVar[Tuple[str, ...]] = (
         "button[aria-label='Next']",
         "button[aria-label*='Next']",
         ".jobs-search-results-list__pagination button:last-child",
         "button[data-cy='page-next']"
-    ])
+    )
 
 
 @dataclass
@@ -142,12 +154,15 @@ class OutputConfig:
     # Directories
     data_dir: str = "data"
     logs_dir: str = "logs"
+    cache_dir: str = "cache"
     
     # File formats
     save_csv: bool = True
     save_json: bool = True
+    save_arrow: bool = False  # requires pyarrow
     csv_filename: str = "linkedin_jobs.csv"
     json_filename: str = "linkedin_jobs.json"
+    arrow_filename: str = "linkedin_jobs.arrow"
     
     # CSV options
     csv_encoding: str = "utf-8"
@@ -157,6 +172,9 @@ class OutputConfig:
     json_indent: int = 2
     json_ensure_ascii: bool = False
     
+    # Arrow options
+    arrow_compression: str = "zstd"
+    
     # Logging
     log_level: str = "INFO"
     log_to_file: bool = True
@@ -206,6 +224,28 @@ class FilterConfig:
 class Config:
     """Main configuration class that combines all config sections."""
     
+    # Environment variable -> (section, attribute, converter)
+    ENV_OVERRIDES = (
+        # Scraping settings
+        ('SCRAPER_DELAY_MIN', 'scraping', 'delay_min', float),
+        ('SCRAPER_DELAY_MAX', 'scraping', 'delay_max', float),
+        ('SCRAPER_MAX_RETRIES', 'scraping', 'max_retries', int),
+        ('SCRAPER_TIMEOUT', 'scraping', 'timeout', int),
+        ('SCRAPER_MAX_CONCURRENCY', 'scraping', 'max_concurrency', int),
+        ('SCRAPER_CACHE_TTL', 'scraping', 'cache_ttl', int),
+        
+        # Selenium settings
+        ('SELENIUM_HEADLESS', 'selenium', 'headless', lambda value: value.lower() == 'true'),
+        ('SELENIUM_WIDTH', 'selenium', 'window_width', int),
+        ('SELENIUM_HEIGHT', 'selenium', 'window_height', int),
+        
+        # Output settings
+        ('DATA_DIR', 'output', 'data_dir', str),
+        ('LOGS_DIR', 'output', 'logs_dir', str),
+        ('CACHE_DIR', 'output', 'cache_dir', str),
+        ('LOG_LEVEL', 'output', 'log_level', str),
+    )
+    
     def __init__(self, config_file: Optional[str] = None):
         """
         Initialize configuration.
@@ -219,6 +259,9 @@ class Config:
         self.output = OutputConfig()
         self.filters = FilterConfig()
         
+        # User agents for rotation, built once per instance
+        self._user_agents = tuple(self._default_user_agents())
+        
         # Load custom configuration if provided
         if config_file and os.path.exists(config_file):
             self.load_from_file(config_file)
@@ -232,8 +275,11 @@ class Config:
     def load_from_file(self, config_file: str) -> None:
         """Load configuration from JSON file."""
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            if orjson is not None:
+                config_data = orjson.loads(Path(config_file).read_bytes())
+            else:
+                with open(config_file, 'r', encoding='utf-8') as f:
+                    config_data = json.load(f)
             
             # Update configuration sections
             for section_name, section_data in config_data.items():
@@ -248,26 +294,19 @@ class Config:
     
     def load_from_env(self) -> None:
         """Load configuration from environment variables."""
-        # Scraping settings
-        self.scraping.delay_min = float(os.getenv('SCRAPER_DELAY_MIN', self.scraping.delay_min))
-        self.scraping.delay_max = float(os.getenv('SCRAPER_DELAY_MAX', self.scraping.delay_max))
-        self.scraping.max_retries = int(os.getenv('SCRAPER_MAX_RETRIES', self.scraping.max_retries))
-        self.scraping.timeout = int(os.getenv('SCRAPER_TIMEOUT', self.scraping.timeout))
+        env = os.environ
         
-        # Selenium settings
-        self.selenium.headless = os.getenv('SELENIUM_HEADLESS', 'true').lower() == 'true'
-        self.selenium.window_width = int(os.getenv('SELENIUM_WIDTH', self.selenium.window_width))
-        self.selenium.window_height = int(os.getenv('SELENIUM_HEIGHT', self.selenium.window_height))
-        
-        # Output settings
-        self.output.data_dir = os.getenv('DATA_DIR', self.output.data_dir)
-        self.output.logs_dir = os.getenv('LOGS_DIR', self.output.logs_dir)
-        self.output.log_level = os.getenv('LOG_LEVEL', self.output.log_level)
+        # Only variables that are actually set are converted and applied
+        for env_key, section_name, attribute, convert in self.ENV_OVERRIDES:
+            if env_key in env:
+                setattr(getattr(self, section_name), attribute, convert(env[env_key]))
     
     def _create_directories(self) -> None:
         """Create necessary directories."""
-        Path(self.output.data_dir).mkdir(exist_ok=True)
-        Path(self.output.logs_dir).mkdir(exist_ok=True)
+        # Checked on every call: a cached "already created" goes stale after
+        # a chdir or if the directory is removed while the process runs
+        os.makedirs(self.output.data_dir, exist_ok=True)
+        os.makedirs(self.output.logs_dir, exist_ok=True)
     
     def get_delay_range(self, scraper_type: str = "basic") -> tuple:
         """Get delay range for specified scraper type."""
@@ -278,6 +317,11 @@ class Config:
     
     def get_user_agent_list(self) -> List[str]:
         """Get list of user agents for rotation."""
+        return list(self._user_agents)
+    
+    @staticmethod
+    def _default_user_agents() -> List[str]:
+        """Built-in user agents used for rotation."""
         return [
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
@@ -288,46 +332,12 @@ class Config:
     
     def get_chrome_options(self) -> List[str]:
         """Get Chrome options for Selenium."""
-        options = []
-        
-        if self.selenium.headless:
-            options.append("--headless=new")
-        
-        options.extend([
-            f"--window-size={self.selenium.window_width},{self.selenium.window_height}",
-            "--start-maximized"
-        ])
-        
-        if self.selenium.no_sandbox:
-            options.append("--no-sandbox")
-        
-        if self.selenium.disable_dev_shm:
-            options.append("--disable-dev-shm-usage")
-        
-        if self.selenium.disable_gpu:
-            options.append("--disable-gpu")
-        
-        if self.selenium.disable_images:
-            options.append("--disable-images")
-        
-        if self.selenium.disable_extensions:
-            options.append("--disable-extensions")
-        
-        if self.selenium.disable_plugins:
-            options.append("--disable-plugins")
-        
-        # Anti-detection options
-        options.extend([
-            "--disable-blink-features=AutomationControlled",
-            "--no-first-run",
-            "--disable-default-apps",
-            "--disable-features=TranslateUI",
-            "--disable-ipc-flooding-protection",
-            "--memory-pressure-off",
-            "--max_old_space_size=4096"
-        ])
-        
-        return options
+        selenium = self.selenium
+        return list(_chrome_options_for(
+            selenium.headless, selenium.window_width, selenium.window_height,
+            selenium.no_sandbox, selenium.disable_dev_shm, selenium.disable_gpu,
+            selenium.disable_images, selenium.disable_extensions, selenium.disable_plugins
+        ))
     
     def get_chrome_prefs(self) -> Dict[str, Any]:
         """Get Chrome preferences for Selenium."""
@@ -353,10 +363,13 @@ class Config:
                 "selenium_delay_max": self.scraping.selenium_delay_max,
                 "max_retries": self.scraping.max_retries,
                 "timeout": self.scraping.timeout,
+                "max_concurrency": self.scraping.max_concurrency,
                 "max_pages_basic": self.scraping.max_pages_basic,
                 "max_pages_selenium": self.scraping.max_pages_selenium,
                 "remove_duplicates": self.scraping.remove_duplicates,
-                "validate_data": self.scraping.validate_data
+                "validate_data": self.scraping.validate_data,
+                "cache_results": self.scraping.cache_results,
+                "cache_ttl": self.scraping.cache_ttl
             },
             "selenium": {
                 "headless": self.selenium.headless,
@@ -369,10 +382,14 @@ class Config:
             "output": {
                 "data_dir": self.output.data_dir,
                 "logs_dir": self.output.logs_dir,
+                "cache_dir": self.output.cache_dir,
                 "save_csv": self.output.save_csv,
                 "save_json": self.output.save_json,
+                "save_arrow": self.output.save_arrow,
                 "csv_filename": self.output.csv_filename,
                 "json_filename": self.output.json_filename,
+                "arrow_filename": self.output.arrow_filename,
+                "arrow_compression": self.output.arrow_compression,
                 "log_level": self.output.log_level,
                 "log_to_file": self.output.log_to_file,
                 "log_to_console": self.output.log_to_console
@@ -380,21 +397,81 @@ class Config:
         }
         
         try:
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                Path(config_file).write_bytes(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(config_file, 'w', encoding='utf-8') as f:
+                    json.dump(config_data, f, indent=2, ensure_ascii=False)
             print(f"Configuration saved to {config_file}")
         except Exception as e:
             print(f"Error saving configuration: {e}")
 
 
+@lru_cache(maxsize=16)
+def _chrome_options_for(headless: bool, window_width: int, window_height: int,
+                        no_sandbox: bool, disable_dev_shm: bool, disable_gpu: bool,
+                        disable_images: bool, disable_extensions: bool,
+                        disable_plugins: bool) -> Tuple[str, ...]:
+    """Build Chrome options once per distinct combination of Selenium settings."""
+    options = []
+    
+    if headless:
+        options.append("--headless=new")
+    
+    options.extend([
+        f"--window-size={window_width},{window_height}",
+        "--start-maximized"
+    ])
+    
+    if no_sandbox:
+        options.append("--no-sandbox")
+    
+    if disable_dev_shm:
+        options.append("--disable-dev-shm-usage")
+    
+    if disable_gpu:
+        options.append("--disable-gpu")
+    
+    if disable_images:
+        options.append("--disable-images")
+    
+    if disable_extensions:
+        options.append("--disable-extensions")
+    
+    if disable_plugins:
+        options.append("--disable-plugins")
+    
+    # Anti-detection options
+    options.extend([
+        "--disable-blink-features=AutomationControlled",
+        "--no-first-run",
+        "--disable-default-apps",
+        "--disable-features=TranslateUI",
+        "--disable-ipc-flooding-protection",
+        "--memory-pressure-off",
+        "--max_old_space_size=4096"
+    ])
+    
+    return tuple(options)
+
+
 # Default configuration instance
 default_config = Config()
 
 
+@lru_cache(maxsize=8)
+def _load_config(config_file: str, mtime: float) -> Config:
+    """Build a Config for a file; cached per (path, modification time)."""
+    return Config(config_file)
+
+
 def get_config(config_file: Optional[str] = None) -> Config:
     """
     Get configuration instance.
     
+    Instances are cached per config file and its modification time, so
+    repeated calls don't reload it but an edited file is picked up.
+    
     Args:
         config_file (str, optional): Path to custom config file
         
@@ -402,5 +479,9 @@ def get_config(config_file: Optional[str] = None) -> Config:
         Config: Configuration instance
     """
     if config_file:
-        return Config(config_file)
+        try:
+            mtime = os.path.getmtime(config_file)
+        except OSError:
+            mtime = 0.0
+        return _load_config(config_file, mtime)
     return default_config 
\ No newline at end of file
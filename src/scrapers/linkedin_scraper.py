@@ -20,14 +20,17 @@ Created: 2025
 
 import httpx
 import asyncio
-from bs4 import BeautifulSoup
-import pandas as pd
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
 import time
 import random
 import csv
 import json
 import logging
-from fake_useragent import UserAgent
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import atexit
+import threading
 from urllib.parse import urlencode, quote_plus
 import os
 from dotenv import load_dotenv
@@ -36,26 +39,154 @@ from pathlib import Path
 import re
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
-import hashlib
+from functools import lru_cache
 import platform
 from collections import Counter, defaultdict
 import math
-import uuid
+import secrets
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON serialization
+    orjson = None
+
+# Host OS, looked up once for user agent and client-hint headers
+PLATFORM_SYSTEM = platform.system()
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:  # optional: faster C-based HTML parsing
+    HTML_PARSER = 'html.parser'
+
+try:
+    import uvloop
+except ImportError:  # optional: faster event loop (not available on Windows)
+    uvloop = None
+
+
+def _run_async(coroutine):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.run(coroutine)
+    return asyncio.run(coroutine)
+
 
 # Load environment variables
 load_dotenv()
 
-# Configure professional logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/harvester.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Background log listener, started by configure_logging()
+_log_listener = None
+_log_console_handler = None
+
+
+def configure_logging(console_level: Optional[int] = None):
+    """
+    Set up professional logging for the harvester.
+    
+    Records are queued and written by a background listener thread to
+    logs/harvester.log and the console, so logging never blocks the event
+    loop on file or console I/O. Nothing is set up at import time; the
+    listener is started on the first call and later calls only adjust the
+    console level.
+    
+    Args:
+        console_level: Minimum level printed to the console (file logging
+            is unaffected); None keeps the current level
+    """
+    global _log_listener, _log_console_handler
+    
+    if _log_listener is None:
+        log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        Path('logs').mkdir(exist_ok=True)
+        file_handler = logging.FileHandler('logs/harvester.log')
+        console_handler = logging.StreamHandler()
+        for handler in (file_handler, console_handler):
+            handler.setFormatter(log_formatter)
+        
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        # Only the message (plus any traceback) is rendered on the calling
+        # side; the listener's handlers apply the full format
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        
+        _log_console_handler = console_handler
+        _log_listener = QueueListener(log_queue, file_handler, console_handler,
+                                      respect_handler_level=True)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)  # flush queued records on exit
+        
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    
+    if console_level is not None:
+        _log_console_handler.setLevel(console_level)
+
+
+@lru_cache(maxsize=256)
+def _css(selector: str):
+    """
+    Compile a CSS selector once and reuse it for every job card.
+    
+    Calling Tag.select/select_one with a string re-resolves the selector
+    through BeautifulSoup and soupsieve on each call; the compiled pattern
+    matches directly.
+    
+    Args:
+        selector: CSS selector string
+    
+    Returns:
+        Compiled soupsieve pattern with select/select_one methods
+    """
+    return soupsieve.compile(selector)
+
+
+class JobCardStrainer(SoupStrainer):
+    """
+    Parse-only filter that keeps just the job card subtrees of a page.
+    
+    Any tag carrying a class or attribute named in the card selectors is
+    kept with everything beneath it, so the selectors still find the same
+    cards while navigation, scripts and footers are never built into the
+    tree. Card selectors therefore need a class or attribute, not just a
+    tag name.
+    """
+    
+    def __init__(self, card_selectors: List[str]):
+        """
+        Initialize the strainer.
+        
+        Args:
+            card_selectors: Job card CSS selectors
+        """
+        super().__init__()
+        joined = ' '.join(card_selectors)
+        self.card_classes = frozenset(re.findall(r'\.([\w-]+)', joined))
+        self.card_attributes = frozenset(re.findall(r'\[([\w-]+)', joined))
+    
+    def _is_job_card(self, attrs) -> bool:
+        """Check a tag's raw attributes against the card markers."""
+        if not attrs:
+            return False
+        if not self.card_attributes.isdisjoint(attrs):
+            return True
+        classes = attrs.get('class') or ()
+        if isinstance(classes, str):
+            classes = classes.split()
+        return not self.card_classes.isdisjoint(classes)
+    
+    # BeautifulSoup 4.13+ parse_only hooks
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return self._is_job_card(attrs)
+    
+    def allow_string_creation(self, string) -> bool:
+        return False
+    
+    # BeautifulSoup < 4.13 parse_only hook
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        return self._is_job_card(markup_attrs)
+
 
 @dataclass
 class HarvestingConfiguration:
@@ -121,6 +252,10 @@ class HarvestingConfiguration:
     # Individual job page extraction (requires additional HTTP requests)
     enable_individual_job_page_extraction: bool = False
     max_individual_pages_to_extract: int = 10
+    
+    # Incremental output: append each page's jobs as JSON Lines while harvesting
+    # (the file is truncated when each harvest starts)
+    stream_output_filename: Optional[str] = None
 
 
 class HumanBehaviorSimulator:
@@ -131,6 +266,9 @@ class HumanBehaviorSimulator:
     break patterns, and simulate human-like interactions with web pages.
     """
     
+    # Fatigue multiplier for each block of 20 requests in a session
+    FATIGUE_MULTIPLIERS = (1.0, 1.2, 1.5, 2.0)
+    
     @staticmethod
     def calculate_realistic_reading_time(content_length: int, reading_speed_wpm: int = 200) -> float:
         """
@@ -143,9 +281,8 @@ class HumanBehaviorSimulator:
         Returns:
             Calculated reading time in seconds (capped between 2-15 seconds)
         """
-        estimated_words = content_length / 5  # Average 5 characters per word
-        reading_time_minutes = estimated_words / reading_speed_wpm
-        reading_time_seconds = reading_time_minutes * 60
+        # Average 5 characters per word: seconds = chars / 5 / wpm * 60
+        reading_time_seconds = content_length * 12.0 / reading_speed_wpm
         
         # Cap between reasonable bounds for web browsing
         return max(2.0, min(15.0, reading_time_seconds))
@@ -155,27 +292,33 @@ class HumanBehaviorSimulator:
         """
         Generate human-like delay with natural variance.
         
-        Human users don't click at perfectly regular intervals. This method
-        adds realistic variance to delays to mimic natural behavior.
+        Human pauses are right-skewed - mostly near a typical value with an
+        occasional long one - so delays are drawn from a log-normal
+        distribution whose median is the base delay, rather than uniformly.
         
         Args:
-            base_delay: Base delay time in seconds
-            variance_factor: Percentage of variance to apply (0.0 to 1.0)
+            base_delay: Median delay time in seconds
+            variance_factor: Spread of the distribution (sigma of the log)
             
         Returns:
             Adjusted delay time with human-like variance
         """
-        variance_range = base_delay * variance_factor
-        variance = random.uniform(-variance_range, variance_range)
-        return max(0.5, base_delay + variance)  # Minimum 0.5 seconds
+        if base_delay <= 0:
+            return 0.5
+        delay = random.lognormvariate(math.log(base_delay), variance_factor)
+        return max(0.5, delay)  # Minimum 0.5 seconds
     
     @staticmethod
     def should_take_break(requests_made: int, break_frequency_range: Tuple[int, int]) -> bool:
         """
         Determine if a break should be taken based on request count.
         
+        Requests are counted since the last break rather than matched with a
+        modulo, so counts that advance several at a time (concurrent waves)
+        cannot skip past a break.
+        
         Args:
-            requests_made: Number of requests made in current session
+            requests_made: Number of requests made since the last break
             break_frequency_range: Tuple of (min, max) requests before break
             
         Returns:
@@ -183,10 +326,10 @@ class HumanBehaviorSimulator:
         """
         min_freq, max_freq = break_frequency_range
         break_interval = random.randint(min_freq, max_freq)
-        return requests_made > 0 and requests_made % break_interval == 0
+        return requests_made > 0 and requests_made >= break_interval
     
-    @staticmethod
-    def calculate_progressive_delay(requests_made: int, base_delay: float) -> float:
+    @classmethod
+    def calculate_progressive_delay(cls, requests_made: int, base_delay: float) -> float:
         """
         Calculate progressively longer delays as session continues.
         
@@ -199,14 +342,83 @@ class HumanBehaviorSimulator:
         Returns:
             Adjusted delay time accounting for session progress
         """
-        if requests_made <= 20:
-            return base_delay
-        elif requests_made <= 40:
-            return base_delay * 1.2
-        elif requests_made <= 60:
-            return base_delay * 1.5
-        else:
-            return base_delay * 2.0
+        block = min(max(requests_made - 1, 0) // 20, len(cls.FATIGUE_MULTIPLIERS) - 1)
+        return base_delay * cls.FATIGUE_MULTIPLIERS[block]
+
+
+class TokenBucketRateLimiter:
+    """
+    Async token bucket that bounds the long-run request rate.
+    
+    Requests are admitted at ``refill_rate`` per second on average, and
+    never closer together than ``min_interval`` seconds (the first one
+    included, counted from when the bucket is created); saved-up tokens
+    (up to ``capacity``) only let requests catch up after a pause, they do
+    not allow back-to-back bursts. Concurrent callers share one bucket, so
+    pages fetched in the same wave are still paced against each other.
+    """
+    
+    def __init__(self, capacity: float, refill_rate: float, min_interval: float = 0.0):
+        """
+        Initialize the token bucket.
+        
+        Args:
+            capacity: Maximum number of tokens
+            refill_rate: Tokens added per second
+            min_interval: Minimum seconds between two admitted requests
+        """
+        if capacity <= 0 or refill_rate <= 0:
+            raise ValueError("capacity and refill_rate must be positive")
+        if min_interval < 0:
+            raise ValueError("min_interval must not be negative")
+        
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.min_interval = min_interval
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        # Counted from creation, so even the first request keeps the gap
+        self.last_admitted = self.last_refill
+        self._lock = asyncio.Lock()
+    
+    def _refill(self):
+        """Add the tokens accumulated since the last refill."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+    
+    async def acquire(self, cost: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, waiting until enough are available.
+        
+        Waiters are served in arrival order. A cost above the capacity is
+        allowed and leaves the bucket in debt for the following callers.
+        
+        Args:
+            cost: Number of tokens this request consumes
+        
+        Returns:
+            Seconds spent waiting for tokens
+        """
+        async with self._lock:
+            self._refill()
+            wait_time = 0.0
+            
+            if self.tokens < cost:
+                wait_time = (cost - self.tokens) / self.refill_rate
+            
+            # Keep the minimum gap after the previous admitted request
+            wait_time = max(wait_time, self.last_admitted + self.min_interval - time.monotonic())
+            
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+                self._refill()
+            else:
+                wait_time = 0.0
+            
+            self.tokens -= cost
+            self.last_admitted = time.monotonic()
+            return wait_time
 
 
 class AdvancedAntiDetectionSystem:
@@ -217,6 +429,32 @@ class AdvancedAntiDetectionSystem:
     header management, and other techniques to avoid detection.
     """
     
+    # Browser versions used to build profiles
+    CHROME_VERSIONS = ('120.0.0.0', '119.0.0.0', '118.0.0.0', '117.0.0.0')
+    FIREFOX_VERSIONS = ('121.0', '120.0', '119.0', '118.0')
+    EDGE_VERSIONS = ('120.0.2210.77', '119.0.2151.72')
+    
+    # Widths of common screen resolutions, sent as viewport-width
+    VIEWPORT_WIDTHS = ('1920', '1366', '1536', '1440', '1280')
+    
+    # User agent platform components per host OS
+    PLATFORM_USER_AGENT_STRINGS = {
+        'Windows': (
+            "Windows NT 10.0; Win64; x64",
+            "Windows NT 10.0; WOW64",
+            "Windows NT 6.1; Win64; x64"
+        ),
+        'Darwin': (
+            "Macintosh; Intel Mac OS X 10_15_7",
+            "Macintosh; Intel Mac OS X 10_14_6",
+            "Macintosh; Intel Mac OS X 10_13_6"
+        ),
+        'Linux': (
+            "X11; Linux x86_64",
+            "X11; Ubuntu; Linux x86_64"
+        )
+    }
+    
     def __init__(self, config: HarvestingConfiguration):
         """
         Initialize the anti-detection system.
@@ -225,7 +463,6 @@ class AdvancedAntiDetectionSystem:
             config: Configuration object with detection avoidance settings
         """
         self.config = config
-        self.user_agent_generator = UserAgent()
         self.request_counter = 0
         self.session_fingerprint = self._generate_session_fingerprint()
         self.browser_profiles = self._create_realistic_browser_profiles()
@@ -240,34 +477,35 @@ class AdvancedAntiDetectionSystem:
             List of browser profile dictionaries with headers and characteristics
         """
         profiles = []
+        chrome_languages = self.config.supported_languages + [
+            'en-US,en;q=0.9', 'en-GB,en;q=0.9', 'en-US,en;q=0.8,es;q=0.7'
+        ]
+        sec_ch_ua_platform = f'"{PLATFORM_SYSTEM}"'
         
         # Chrome profiles (most common browser)
-        chrome_versions = ['120.0.0.0', '119.0.0.0', '118.0.0.0', '117.0.0.0']
-        for version in chrome_versions:
+        for version in self.CHROME_VERSIONS:
+            major_version = version.split(".")[0]
             platform_string = self._get_platform_user_agent_string()
             profiles.append({
                 'browser': 'chrome',
                 'version': version,
                 'user_agent': f'Mozilla/5.0 ({platform_string}) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{version} Safari/537.36',
                 'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                'accept_language': random.choice(self.config.supported_languages + [
-                    'en-US,en;q=0.9', 'en-GB,en;q=0.9', 'en-US,en;q=0.8,es;q=0.7'
-                ]),
+                'accept_language': random.choice(chrome_languages),
                 'accept_encoding': 'gzip, deflate, br',
                 'sec_fetch_dest': 'document',
                 'sec_fetch_mode': 'navigate',
                 'sec_fetch_site': 'none',
                 'sec_fetch_user': '?1',
-                'sec_ch_ua': f'"Not_A Brand";v="8", "Chromium";v="{version.split(".")[0]}", "Google Chrome";v="{version.split(".")[0]}"',
+                'sec_ch_ua': f'"Not_A Brand";v="8", "Chromium";v="{major_version}", "Google Chrome";v="{major_version}"',
                 'sec_ch_ua_mobile': '?0',
-                'sec_ch_ua_platform': f'"{platform.system()}"',
+                'sec_ch_ua_platform': sec_ch_ua_platform,
                 'upgrade_insecure_requests': '1',
                 'cache_control': 'max-age=0'
             })
         
         # Firefox profiles
-        firefox_versions = ['121.0', '120.0', '119.0', '118.0']
-        for version in firefox_versions:
+        for version in self.FIREFOX_VERSIONS:
             platform_string = self._get_platform_user_agent_string()
             profiles.append({
                 'browser': 'firefox',
@@ -281,8 +519,7 @@ class AdvancedAntiDetectionSystem:
             })
         
         # Edge profiles
-        edge_versions = ['120.0.2210.77', '119.0.2151.72']
-        for version in edge_versions:
+        for version in self.EDGE_VERSIONS:
             platform_string = self._get_platform_user_agent_string()
             profiles.append({
                 'browser': 'edge',
@@ -298,6 +535,17 @@ class AdvancedAntiDetectionSystem:
                 'upgrade_insecure_requests': '1'
             })
         
+        # Precompute each profile's HTTP headers once: metadata dropped and
+        # field names converted to their hyphenated wire form. Accept-Encoding
+        # is left to httpx, which only advertises codecs it can decode (br and
+        # zstd once the brotli/zstandard extras are installed).
+        for profile in profiles:
+            profile['http_headers'] = {
+                key.replace('_', '-'): value
+                for key, value in profile.items()
+                if key not in ('browser', 'version', 'accept_encoding')
+            }
+        
         return profiles
     
     def _get_platform_user_agent_string(self) -> str:
@@ -307,24 +555,10 @@ class AdvancedAntiDetectionSystem:
         Returns:
             Platform-appropriate user agent string component
         """
-        system = platform.system()
-        if system == "Windows":
-            return random.choice([
-                "Windows NT 10.0; Win64; x64",
-                "Windows NT 10.0; WOW64",
-                "Windows NT 6.1; Win64; x64"
-            ])
-        elif system == "Darwin":
-            return random.choice([
-                "Macintosh; Intel Mac OS X 10_15_7",
-                "Macintosh; Intel Mac OS X 10_14_6",
-                "Macintosh; Intel Mac OS X 10_13_6"
-            ])
-        else:  # Linux
-            return random.choice([
-                "X11; Linux x86_64",
-                "X11; Ubuntu; Linux x86_64"
-            ])
+        # Anything other than Windows/macOS is presented as Linux
+        return random.choice(
+            self.PLATFORM_USER_AGENT_STRINGS.get(PLATFORM_SYSTEM, self.PLATFORM_USER_AGENT_STRINGS['Linux'])
+        )
     
     def get_stealth_headers(self) -> Dict[str, str]:
         """
@@ -341,11 +575,7 @@ class AdvancedAntiDetectionSystem:
             self.last_profile_rotation = self.request_counter
         
         # Base headers from current browser profile
-        headers = dict(self.current_browser_profile)
-        
-        # Remove metadata fields that shouldn't be in HTTP headers
-        headers.pop('browser', None)
-        headers.pop('version', None)
+        headers = dict(self.current_browser_profile['http_headers'])
         
         # Add dynamic headers
         headers.update({
@@ -354,11 +584,8 @@ class AdvancedAntiDetectionSystem:
             'pragma': 'no-cache',
         })
         
-        # Add random viewport size (common screen resolutions)
-        viewport_sizes = [
-            '1920,1080', '1366,768', '1536,864', '1440,900', '1280,720'
-        ]
-        headers['viewport-width'] = random.choice(viewport_sizes).split(',')[0]
+        # Add random viewport width (common screen resolutions)
+        headers['viewport-width'] = random.choice(self.VIEWPORT_WIDTHS)
         
         return headers
     
@@ -369,14 +596,7 @@ class AdvancedAntiDetectionSystem:
         Returns:
             Unique session fingerprint string
         """
-        components = [
-            str(time.time()),
-            str(uuid.uuid4()),
-            platform.system(),
-            str(random.randint(100000, 999999))
-        ]
-        fingerprint_string = ''.join(components)
-        return hashlib.sha256(fingerprint_string.encode()).hexdigest()[:16]
+        return secrets.token_hex(8)
     
     def get_current_browser_info(self) -> Dict[str, str]:
         """
@@ -478,6 +698,8 @@ class EnhancedLinkedInJobHarvester:
             '.jobs-unified-top-card__subtitle-secondary-grouping'
         ]
     }
+    
+    JOB_CARD_STRAINER = JobCardStrainer(ADVANCED_SELECTORS['job_cards'])
 
     # Enhanced selectors for detailed job data extraction
     DETAILED_EXTRACTION_SELECTORS = {
@@ -608,9 +830,58 @@ class EnhancedLinkedInJobHarvester:
         'SG': 'sg.linkedin.com'
     }
     
+    # Spam markers in job titles, matched in a single scan of the upper-cased title
+    SPAM_TITLE_PATTERN = re.compile('|'.join(map(re.escape, [
+        '🚀', '💰', '🔥', '💯', 'URGENT', 'IMMEDIATE', 'HURRY',
+        'MAKE MONEY FAST', 'WORK FROM HOME GUARANTEED'
+    ])))
+    
+    LETTER_PATTERN = re.compile(r'[a-zA-Z]')
+    WHITESPACE_PATTERN = re.compile(r'\s+')
+    TRAILING_ARTIFACT_PATTERN = re.compile(r'\b(new|hiring|actively recruiting)\s*$', re.IGNORECASE)
+    
+    # Markers of login walls and bot challenges, checked in the final URL and
+    # the start of the document before any parsing
+    BLOCK_PAGE_MARKERS = ('/authwall', '/checkpoint/challenge')
+    BLOCK_PAGE_SNIFF_LENGTH = 4096
+    
+    # Outcomes of fetching one results page
+    PAGE_SUCCEEDED = 'succeeded'
+    PAGE_FAILED = 'failed'
+    PAGE_BLOCKED = 'blocked'
+    
+    # Column order for tabular output, including enhanced extraction fields
+    TABULAR_FIELDNAMES = (
+        # Core job information
+        'title', 'company', 'location', 'posted_date', 'job_url',
+        
+        # Basic metadata
+        'salary_info', 'applicant_count', 'job_insights',
+        
+        # Enhanced extraction fields
+        'job_description', 'job_requirements', 'job_responsibilities',
+        'benefits_info', 'company_culture', 'enhanced_salary_info',
+        'enhanced_applicant_count', 'application_type', 'job_urgency',
+        'experience_level', 'employment_type', 'remote_work_option',
+        
+        # Company intelligence
+        'company_size', 'company_industry', 'company_logo_url',
+        'company_headquarters', 'company_website',
+        
+        # Structured data from JSON-LD
+        'structured_title', 'structured_description', 'structured_salary',
+        'structured_company', 'structured_location', 'structured_employment_type',
+        'structured_work_location', 'full_job_description', 'job_criteria',
+        
+        # System metadata
+        'harvested_at', 'harvester_version', 'data_source_region',
+        'extraction_method', 'data_quality_score'
+    )
+    
     def __init__(self, output_directory: str = "harvested_data", 
                  config: Optional[HarvestingConfiguration] = None,
-                 region: str = "US"):
+                 region: str = "US",
+                 http_client: Optional[httpx.AsyncClient] = None):
         """
         Initialize the LinkedIn Job Harvester.
         
@@ -618,11 +889,22 @@ class EnhancedLinkedInJobHarvester:
             output_directory: Directory path for saving harvested data
             config: Configuration object for harvesting parameters
             region: Regional code for LinkedIn domain (US, UK, CA, etc.)
+            http_client: Optional caller-owned client (e.g. with a response
+                cache) to share across harvests; it is never closed here
         """
         self.config = config or HarvestingConfiguration()
         self.behavior_simulator = HumanBehaviorSimulator()
         self.anti_detection_system = AdvancedAntiDetectionSystem(self.config)
         
+        # Request pacing: long-run rate of one request per mean configured
+        # delay, with at least minimum_request_delay between any two requests
+        mean_request_delay = (self.config.minimum_request_delay + self.config.maximum_request_delay) / 2
+        self.rate_limiter = TokenBucketRateLimiter(
+            capacity=max(1, self.config.concurrent_request_limit),
+            refill_rate=1.0 / max(mean_request_delay, 0.01),
+            min_interval=self.config.minimum_request_delay
+        )
+        
         # Set up regional configuration
         self.region = region.upper()
         self.base_domain = self.REGIONAL_DOMAINS.get(self.region, self.REGIONAL_DOMAINS['US'])
@@ -630,14 +912,18 @@ class EnhancedLinkedInJobHarvester:
         
         # Data storage
         self.harvested_jobs_data = []
+        self._seen_job_urls = set()
+        self.results_from_cache = False
         self.output_directory = Path(output_directory)
         self.output_directory.mkdir(exist_ok=True)
         
         # Session management
-        self.http_client = None
+        self.http_client = http_client
+        self._owns_http_client = http_client is None
         self.requests_made_in_session = 0
-        self.session_start_timestamp = time.time()
-        self.last_request_timestamp = 0
+        self.session_start_timestamp = time.monotonic()
+        self._stealth_header_names = set()
+        self._recovery_lock = asyncio.Lock()
         
         # Quality tracking
         self.extraction_statistics = defaultdict(int)
@@ -648,19 +934,34 @@ class EnhancedLinkedInJobHarvester:
     
     async def __aenter__(self):
         """Async context manager entry point."""
-        await self._initialize_http_client()
+        if self.http_client is None:
+            await self._initialize_http_client()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit point."""
         await self._cleanup_http_client()
     
-    async def _initialize_http_client(self):
+    @staticmethod
+    def build_http_client(config: Optional[HarvestingConfiguration] = None,
+                          headers: Optional[Dict[str, str]] = None) -> httpx.AsyncClient:
         """
-        Initialize HTTPX client with optimal performance settings.
+        Build an HTTPX client with the harvester's pooling and timeout settings.
         
-        Sets up HTTP/2 support, connection pooling, timeouts, and headers.
+        Pass the result as ``http_client`` to harvesters run one after another
+        on the same event loop so they share one connection pool and TLS
+        sessions (stealth headers live on the client, so don't run them
+        concurrently); the caller closes it when done.
+        
+        Args:
+            config: Configuration supplying the request timeout
+            headers: Default headers for the client
+        
+        Returns:
+            Configured HTTP/2 client
         """
+        config = config or HarvestingConfiguration()
+        
         # Configure connection limits for optimal performance
         connection_limits = httpx.Limits(
             max_keepalive_connections=15,
@@ -670,7 +971,7 @@ class EnhancedLinkedInJobHarvester:
         
         # Configure timeouts
         timeout_config = httpx.Timeout(
-            timeout=self.config.request_timeout_seconds,
+            timeout=config.request_timeout_seconds,
             connect=10.0,
             read=25.0,
             write=5.0,
@@ -678,20 +979,48 @@ class EnhancedLinkedInJobHarvester:
         )
         
         # Initialize client with advanced features
-        self.http_client = httpx.AsyncClient(
+        return httpx.AsyncClient(
             limits=connection_limits,
             timeout=timeout_config,
             http2=True,  # Enable HTTP/2 for better performance
             follow_redirects=True,
-            headers=self.anti_detection_system.get_stealth_headers(),
+            headers=headers,
             verify=True  # Enable SSL verification for security
         )
+    
+    async def _initialize_http_client(self):
+        """
+        Initialize HTTPX client with optimal performance settings.
+        
+        Sets up HTTP/2 support, connection pooling, timeouts, and headers.
+        """
+        self.http_client = self.build_http_client(self.config, self._next_stealth_headers())
         
         logger.info("HTTP client initialized with HTTP/2 support and advanced features")
     
+    def _next_stealth_headers(self) -> Dict[str, str]:
+        """Get the next stealth header set and remember which names it uses."""
+        headers = self.anti_detection_system.get_stealth_headers()
+        self._stealth_header_names = set(headers)
+        return headers
+    
+    def _apply_stealth_headers(self):
+        """
+        Rotate the client's stealth headers.
+        
+        Headers from the previous profile that the new one doesn't set are
+        removed, so e.g. Chrome client hints don't leak into a Firefox
+        profile. Headers the caller set on a shared client are left alone.
+        """
+        previous_names = self._stealth_header_names
+        headers = self._next_stealth_headers()
+        for name in previous_names - self._stealth_header_names:
+            self.http_client.headers.pop(name, None)
+        self.http_client.headers.update(headers)
+    
     async def _cleanup_http_client(self):
         """Clean up HTTP client resources."""
-        if self.http_client:
+        if self.http_client and self._owns_http_client:
             await self.http_client.aclose()
             logger.info("HTTP client cleaned up")
     
@@ -703,6 +1032,12 @@ class EnhancedLinkedInJobHarvester:
         """
         Harvest job listings from LinkedIn with advanced filtering and extraction.
         
+        Pages are fetched concurrently in waves of up to
+        ``concurrent_request_limit`` requests; session resets, breaks and
+        failure handling (including a single recovery when pages were
+        blocked) are applied between waves, never while requests are in
+        flight on the shared client.
+        
         Args:
             search_keywords: Job title or keywords to search for
             target_location: Geographic location for job search
@@ -722,57 +1057,81 @@ class EnhancedLinkedInJobHarvester:
         search_parameters = self._construct_search_parameters(
             search_keywords, target_location, **additional_filters
         )
+        # Encoded once; pages only differ in the trailing start offset
+        base_search_url = self._build_search_url(search_parameters)
+        
+        # Each harvest gets a fresh stream file instead of appending to
+        # rows left by an earlier run
+        if self.config.stream_output_filename:
+            self._start_stream_output()
         
         # Initialize counters
         successful_pages = 0
         failed_pages = 0
-        
-        # Process pages sequentially with intelligent pacing
-        for page_number in range(maximum_pages):
-            try:
-                # Check session health and reset if needed
-                if self.requests_made_in_session >= self.config.max_requests_per_session:
-                    await self._reset_session_completely()
-                
-                # Implement human-like break patterns
-                if self.behavior_simulator.should_take_break(
-                    self.requests_made_in_session, 
-                    self.config.break_frequency_range
-                ):
-                    await self._take_human_like_break()
-                
-                # Configure pagination
-                search_parameters['start'] = page_number * 25
-                search_url = self._build_search_url(search_parameters)
-                
-                logger.info(f"Processing page {page_number + 1}/{maximum_pages}")
-                
-                # Execute request with intelligent retry logic
-                page_success = await self._execute_intelligent_request(search_url)
+        requests_since_break = 0
+        wave_size = max(1, self.config.concurrent_request_limit)
+        
+        # Process pages in concurrent waves with intelligent pacing
+        for wave_start in range(0, maximum_pages, wave_size):
+            # Check session health and reset if needed
+            if self.requests_made_in_session >= self.config.max_requests_per_session:
+                await self._reset_session_completely(reconnect=False)
+            
+            # Implement human-like break patterns
+            if self.behavior_simulator.should_take_break(
+                requests_since_break, 
+                self.config.break_frequency_range
+            ):
+                await self._take_human_like_break()
+                requests_since_break = 0
+            
+            wave_pages = range(wave_start, min(wave_start + wave_size, maximum_pages))
+            requests_before_wave = self.requests_made_in_session
+            outcomes = await asyncio.gather(
+                *(self._harvest_page(base_search_url, page_number, maximum_pages)
+                  for page_number in wave_pages),
+                return_exceptions=True
+            )
+            requests_since_break += self.requests_made_in_session - requests_before_wave
+            
+            # Pages finish in any order; their jobs are merged, deduplicated
+            # and streamed in page order so the output is deterministic
+            wave_failed = False
+            wave_blocked = False
+            for page_number, outcome in zip(wave_pages, outcomes):
+                if isinstance(outcome, Exception):
+                    failed_pages += 1
+                    wave_failed = True
+                    logger.error(f"Unexpected error processing page {page_number + 1}: {str(outcome)}")
+                    continue
                 
-                if page_success:
+                status, page_extraction = outcome
+                if status == self.PAGE_SUCCEEDED:
                     successful_pages += 1
+                    if page_extraction is not None:
+                        self._merge_page_jobs(*page_extraction)
                     logger.info(f"Successfully processed page {page_number + 1}")
                 else:
                     failed_pages += 1
-                    logger.warning(f"Failed to process page {page_number + 1}")
-                    
-                    # Implement adaptive failure handling
-                    if failed_pages >= 2:
-                        logger.error("Multiple failures detected - implementing recovery strategy")
-                        await self._implement_recovery_strategy()
-                        
-                    if failed_pages >= 3:
-                        logger.error("Too many failures - terminating harvest")
-                        break
-                
-            except Exception as e:
-                failed_pages += 1
-                logger.error(f"Unexpected error processing page {page_number + 1}: {str(e)}")
-                
-                if failed_pages >= 3:
-                    logger.error("Critical failure threshold reached - stopping harvest")
-                    break
+                    wave_failed = True
+                    if status == self.PAGE_BLOCKED:
+                        wave_blocked = True
+                        logger.warning(f"Page {page_number + 1} was blocked")
+                    else:
+                        logger.warning(f"Failed to process page {page_number + 1}")
+            
+            # Implement adaptive failure handling
+            if failed_pages >= 3:
+                logger.error("Too many failures - terminating harvest")
+                break
+            
+            # One recovery per wave, after all of its requests have finished
+            if wave_blocked:
+                logger.error("Blocking detected - implementing recovery strategy")
+                await self._implement_recovery_strategy()
+            elif wave_failed and failed_pages >= 2:
+                logger.error("Multiple failures detected - implementing recovery strategy")
+                await self._implement_recovery_strategy()
         
         # Log final results
         total_jobs = len(self.harvested_jobs_data)
@@ -781,6 +1140,27 @@ class EnhancedLinkedInJobHarvester:
         
         return self.harvested_jobs_data
     
+    async def _harvest_page(self, base_search_url: str, page_number: int, 
+                            maximum_pages: int) -> Tuple[str, Optional[Tuple[List[Dict], int]]]:
+        """
+        Fetch and extract a single search results page.
+        
+        The extracted jobs are returned rather than stored, so harvest_jobs
+        can merge the pages of a wave in page order.
+        
+        Args:
+            base_search_url: Search URL shared by all pages, without the offset
+            page_number: Zero-based page index
+            maximum_pages: Total number of pages in this harvest (for logging)
+        
+        Returns:
+            Tuple of (PAGE_SUCCEEDED, PAGE_FAILED or PAGE_BLOCKED, extracted
+            jobs and failed count, or None when nothing was extracted)
+        """
+        search_url = f"{base_search_url}&start={page_number * 25}"
+        logger.info(f"Processing page {page_number + 1}/{maximum_pages}")
+        return await self._execute_intelligent_request(search_url)
+    
     def _construct_search_parameters(self, keywords: str, location: str, **filters) -> Dict:
         """
         Construct optimized search parameters for LinkedIn job search.
@@ -824,15 +1204,20 @@ class EnhancedLinkedInJobHarvester:
         encoded_params = urlencode(parameters, quote_via=quote_plus)
         return f"{self.base_url}/jobs/search?{encoded_params}"
     
-    async def _execute_intelligent_request(self, url: str) -> bool:
+    async def _execute_intelligent_request(self, url: str) -> Tuple[str, Optional[Tuple[List[Dict], int]]]:
         """
         Execute HTTP request with intelligent retry logic and error handling.
         
+        Blocking is only reported, not recovered from here: other pages of
+        the wave may still be using the shared client, so harvest_jobs runs
+        the recovery once the wave has finished.
+        
         Args:
             url: Target URL for the request
             
         Returns:
-            True if request was successful, False otherwise
+            Tuple of (PAGE_SUCCEEDED, PAGE_FAILED or PAGE_BLOCKED, extracted
+            jobs and failed count, or None when nothing was extracted)
         """
         if not self.http_client:
             await self._initialize_http_client()
@@ -842,21 +1227,26 @@ class EnhancedLinkedInJobHarvester:
                 # Apply intelligent delay before request
                 await self._apply_intelligent_delay()
                 
+                # Number the request before awaiting it, so concurrent pages
+                # never share a number and rotate headers only once
+                request_number = self.requests_made_in_session
+                self.requests_made_in_session += 1
+                
                 # Rotate headers periodically for stealth
-                if (self.requests_made_in_session % 
-                    self.config.user_agent_rotation_frequency == 0):
-                    self.http_client.headers.update(
-                        self.anti_detection_system.get_stealth_headers()
-                    )
+                if request_number % self.config.user_agent_rotation_frequency == 0:
+                    self._apply_stealth_headers()
                 
                 # Execute the HTTP request
                 response = await self.http_client.get(url)
-                self.requests_made_in_session += 1
                 
                 # Handle different response status codes
                 if response.status_code == 200:
-                    await self._extract_jobs_from_html(response.text)
-                    return True
+                    if self._is_block_page(response):
+                        logger.error("Login wall or bot challenge served")
+                        self.extraction_statistics['blocked_pages'] += 1
+                        return self.PAGE_BLOCKED, None
+                    page_extraction = await self._extract_jobs_from_html(response.text)
+                    return self.PAGE_SUCCEEDED, page_extraction
                     
                 elif response.status_code == 429:
                     # Rate limited - implement intelligent backoff
@@ -866,13 +1256,12 @@ class EnhancedLinkedInJobHarvester:
                     await asyncio.sleep(backoff_time)
                     
                 elif response.status_code == 403:
-                    logger.error("Access forbidden - implementing recovery strategy")
-                    await self._implement_recovery_strategy()
-                    return False
+                    logger.error("Access forbidden")
+                    return self.PAGE_BLOCKED, None
                     
                 elif response.status_code in [404, 410]:
                     logger.warning(f"Resource not found (HTTP {response.status_code})")
-                    return False
+                    return self.PAGE_FAILED, None
                     
                 else:
                     logger.warning(f"HTTP {response.status_code} on attempt {attempt + 1}")
@@ -893,43 +1282,51 @@ class EnhancedLinkedInJobHarvester:
                 await asyncio.sleep(self.config.exponential_backoff_base ** attempt)
         
         self.extraction_statistics['failed_requests'] += 1
-        return False
+        return self.PAGE_FAILED, None
+    
+    def _is_block_page(self, response: httpx.Response) -> bool:
+        """
+        Cheaply detect a login wall or bot challenge served with HTTP 200.
+        
+        Only the final URL and the start of the document are inspected, so
+        blocked pages are rejected without being parsed.
+        
+        Args:
+            response: Successful response for a search results page
+        
+        Returns:
+            True if the response is a block page rather than search results
+        """
+        final_path = response.url.path
+        document_head = response.text[:self.BLOCK_PAGE_SNIFF_LENGTH].lower()
+        return any(marker in final_path or marker in document_head
+                   for marker in self.BLOCK_PAGE_MARKERS)
     
     async def _apply_intelligent_delay(self):
         """
         Apply intelligent delays that mimic human behavior patterns.
-        """
-        current_time = time.time()
-        
-        # Ensure minimum interval between requests
-        if self.last_request_timestamp > 0:
-            time_since_last = current_time - self.last_request_timestamp
-            min_interval = self.config.minimum_request_delay
-            
-            if time_since_last < min_interval:
-                additional_wait = min_interval - time_since_last
-                await asyncio.sleep(additional_wait)
-        
-        # Calculate base delay with human-like variance
-        base_delay = random.uniform(
-            self.config.minimum_request_delay,
-            self.config.maximum_request_delay
-        )
         
+        The shared token bucket sets the overall request rate and keeps at
+        least ``minimum_request_delay`` between requests; later requests in a
+        session cost more tokens (human fatigue). A short human-like pause,
+        drawn log-normally like other human delays, is taken before queueing
+        at the bucket, so the request goes out as soon as it is admitted and
+        the minimum gap holds.
+        """
         # Apply human variance
-        human_delay = self.behavior_simulator.generate_human_like_delay(
-            base_delay, self.config.human_variance_factor
+        jitter = self.behavior_simulator.generate_human_like_delay(
+            self.config.minimum_request_delay * self.config.human_variance_factor,
+            self.config.human_variance_factor
         )
+        await asyncio.sleep(jitter)
         
-        # Apply progressive delay based on session progress
-        progressive_delay = self.behavior_simulator.calculate_progressive_delay(
-            self.requests_made_in_session, human_delay
+        # Apply progressive cost based on session progress
+        request_cost = self.behavior_simulator.calculate_progressive_delay(
+            self.requests_made_in_session, 1.0
         )
+        bucket_wait = await self.rate_limiter.acquire(request_cost)
         
-        logger.debug(f"Applying intelligent delay: {progressive_delay:.2f} seconds")
-        await asyncio.sleep(progressive_delay)
-        
-        self.last_request_timestamp = time.time()
+        logger.debug(f"Applying intelligent delay: {jitter + bucket_wait:.2f} seconds")
     
     async def _take_human_like_break(self):
         """Take a human-like break between batches of requests."""
@@ -940,86 +1337,179 @@ class EnhancedLinkedInJobHarvester:
     async def _implement_recovery_strategy(self):
         """
         Implement comprehensive recovery strategy for detection/blocking.
-        """
-        logger.info("Implementing comprehensive recovery strategy")
-        
-        # Complete session reset
-        await self._reset_session_completely()
         
-        # Extended cooling-off period
-        cooldown_duration = random.uniform(180, 420)  # 3-7 minutes
-        logger.info(f"Extended cooldown period: {cooldown_duration:.1f} seconds")
-        await asyncio.sleep(cooldown_duration)
+        Must only run while no requests are in flight, since the session
+        reset replaces the HTTP client. Concurrent callers share a single
+        recovery instead of each starting their own.
+        """
+        if self._recovery_lock.locked():
+            # Another task is already recovering; wait for it to finish
+            async with self._recovery_lock:
+                return
         
-        # Reset request counter
-        self.requests_made_in_session = 0
+        async with self._recovery_lock:
+            logger.info("Implementing comprehensive recovery strategy")
+            
+            # Complete session reset
+            await self._reset_session_completely()
+            
+            # Extended cooling-off period
+            cooldown_duration = random.uniform(180, 420)  # 3-7 minutes
+            logger.info(f"Extended cooldown period: {cooldown_duration:.1f} seconds")
+            await asyncio.sleep(cooldown_duration)
+            
+            # Reset request counter
+            self.requests_made_in_session = 0
     
-    async def _reset_session_completely(self):
+    async def _reset_session_completely(self, reconnect: bool = True):
         """
         Completely reset the session with new fingerprint and headers.
+        
+        Args:
+            reconnect: Also replace an owned HTTP client, dropping its pooled
+                connections. Otherwise the new identity is applied to the
+                existing client, so the next request reuses a warm connection
+                instead of paying a fresh TCP/TLS handshake.
         """
         logger.info("Performing complete session reset")
         
-        # Close existing client
-        if self.http_client:
-            await self.http_client.aclose()
-        
         # Generate new anti-detection profile
         self.anti_detection_system = AdvancedAntiDetectionSystem(self.config)
         
-        # Reinitialize HTTP client
-        await self._initialize_http_client()
+        if reconnect and self._owns_http_client:
+            # Close existing client and reinitialize with the new profile
+            if self.http_client:
+                await self.http_client.aclose()
+            await self._initialize_http_client()
+        elif self.http_client is not None:
+            # Keep the connections (and any caller-provided client); only
+            # rotate the identity
+            self.http_client.cookies.clear()
+            self._apply_stealth_headers()
         
         # Reset session tracking
         self.requests_made_in_session = 0
-        self.session_start_timestamp = time.time()
+        self.session_start_timestamp = time.monotonic()
     
-    async def _extract_jobs_from_html(self, html_content: str):
+    async def _extract_jobs_from_html(self, html_content: str) -> Optional[Tuple[List[Dict], int]]:
         """
         Extract job information from HTML content using advanced techniques.
         
+        The jobs are returned, not stored; pass them to _merge_page_jobs.
+        
         Args:
             html_content: Raw HTML content from LinkedIn job search page
-        """
-        soup = BeautifulSoup(html_content, 'html.parser')
         
-        # Find job cards using multiple selector strategies
-        job_cards = self._find_job_cards_with_fallbacks(soup)
+        Returns:
+            Tuple of (valid jobs, failed extraction count), or None if the
+            page has no job cards
+        """
+        # Parsing and selector matching are CPU-bound; run them on a worker
+        # thread so other pages keep fetching in the meantime
+        loop = asyncio.get_running_loop()
+        extraction_started = time.monotonic()
+        page_extraction = await loop.run_in_executor(
+            None, self._extract_jobs_from_page, html_content
+        )
+        extraction_time = time.monotonic() - extraction_started
         
-        if not job_cards:
+        if page_extraction is None:
             logger.warning("No job cards found in HTML content")
             self.extraction_statistics['pages_with_no_jobs'] += 1
-            return
+            return None
         
-        # Simulate realistic content reading time
+        # Simulate realistic content reading time; time already spent
+        # extracting the page counts towards it
         content_length = len(html_content)
         reading_time = self.behavior_simulator.calculate_realistic_reading_time(content_length)
-        await asyncio.sleep(reading_time)
+        remaining_reading_time = reading_time - extraction_time
+        if remaining_reading_time > 0:
+            await asyncio.sleep(remaining_reading_time)
+        
+        return page_extraction
+    
+    def _merge_page_jobs(self, extracted_jobs: List[Dict], failed_extractions: int):
+        """
+        Add one page's extracted jobs to the harvest.
+        
+        Duplicates of already harvested postings are skipped, statistics are
+        updated and the new jobs are streamed out when enabled. Call it for
+        pages in page order so the first copy of a posting is the one kept.
+        
+        Args:
+            extracted_jobs: Valid jobs extracted from the page
+            failed_extractions: Number of job cards that failed extraction
+        """
+        # Overlapping result pages can repeat a posting; keep the first copy
+        new_jobs = []
+        duplicate_jobs = 0
+        for job_data in extracted_jobs:
+            job_url = job_data.get('job_url')
+            if job_url:
+                # Tracking parameters differ between loads of the same posting
+                url_key = job_url.split('?', 1)[0]
+                if url_key in self._seen_job_urls:
+                    duplicate_jobs += 1
+                    continue
+                self._seen_job_urls.add(url_key)
+            new_jobs.append(job_data)
+        
+        successful_extractions = len(new_jobs)
+        page_start_index = len(self.harvested_jobs_data)
+        self.harvested_jobs_data.extend(new_jobs)
+        self.quality_metrics['extraction_quality'].extend(
+            job_data.get('data_quality_score', 0) for job_data in new_jobs
+        )
+        
+        # Update statistics
+        self.extraction_statistics['successful_extractions'] += successful_extractions
+        self.extraction_statistics['failed_extractions'] += failed_extractions
+        if duplicate_jobs:
+            self.extraction_statistics['duplicate_jobs_skipped'] += duplicate_jobs
+        
+        if self.config.stream_output_filename and successful_extractions:
+            self._append_jobs_to_stream(self.harvested_jobs_data[page_start_index:])
         
-        # Extract data from each job card
-        successful_extractions = 0
+        logger.info(f"Extracted {successful_extractions} jobs, {failed_extractions} failed")
+    
+    def _extract_jobs_from_page(self, html_content: str) -> Optional[Tuple[List[Dict], int]]:
+        """
+        Parse a results page and extract every job card that passes validation.
+        
+        Only the returned job dicts are touched, so this is safe to run on a
+        worker thread.
+        
+        Args:
+            html_content: Raw HTML content from LinkedIn job search page
+        
+        Returns:
+            Tuple of (valid jobs, failed extraction count), or None if the
+            page has no job cards
+        """
+        soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=self.JOB_CARD_STRAINER)
+        
+        # Find job cards using multiple selector strategies
+        job_cards = self._find_job_cards_with_fallbacks(soup)
+        if not job_cards:
+            return None
+        
+        # Extract data from each job card; one timestamp covers the page
+        extracted_jobs = []
         failed_extractions = 0
+        harvested_at = datetime.now().isoformat()
         
         for job_card in job_cards:
             try:
-                job_data = self._extract_comprehensive_job_data(job_card)
+                job_data = self._extract_comprehensive_job_data(job_card, harvested_at)
                 if job_data and self._validate_job_data_quality(job_data):
-                    self.harvested_jobs_data.append(job_data)
-                    successful_extractions += 1
-                    self.quality_metrics['extraction_quality'].append(
-                        job_data.get('data_quality_score', 0)
-                    )
+                    extracted_jobs.append(job_data)
                 else:
                     failed_extractions += 1
             except Exception as e:
                 failed_extractions += 1
                 logger.debug(f"Error extracting job data: {str(e)}")
         
-        # Update statistics
-        self.extraction_statistics['successful_extractions'] += successful_extractions
-        self.extraction_statistics['failed_extractions'] += failed_extractions
-        
-        logger.info(f"Extracted {successful_extractions} jobs, {failed_extractions} failed")
+        return extracted_jobs, failed_extractions
     
     def _find_job_cards_with_fallbacks(self, soup: BeautifulSoup) -> List:
         """
@@ -1032,7 +1522,7 @@ class EnhancedLinkedInJobHarvester:
             List of job card elements
         """
         for selector in self.ADVANCED_SELECTORS['job_cards']:
-            job_cards = soup.select(selector)
+            job_cards = _css(selector).select(soup)
             if job_cards:
                 logger.debug(f"Found {len(job_cards)} job cards using selector: {selector}")
                 return job_cards
@@ -1040,12 +1530,13 @@ class EnhancedLinkedInJobHarvester:
         logger.warning("No job cards found with any selector")
         return []
     
-    def _extract_comprehensive_job_data(self, job_card) -> Optional[Dict]:
+    def _extract_comprehensive_job_data(self, job_card, harvested_at: Optional[str] = None) -> Optional[Dict]:
         """
         Extract comprehensive job data from a job card element.
         
         Args:
             job_card: BeautifulSoup element representing a job card
+            harvested_at: ISO timestamp shared by the page's jobs (defaults to now)
             
         Returns:
             Dictionary containing extracted job data or None if extraction fails
@@ -1076,7 +1567,7 @@ class EnhancedLinkedInJobHarvester:
         
         # Add extraction metadata
         job_data.update({
-            'harvested_at': datetime.now().isoformat(),
+            'harvested_at': harvested_at or datetime.now().isoformat(),
             'harvester_version': '3.0.0',
             'data_source_region': self.region,
             'extraction_method': 'advanced_fallback',
@@ -1098,7 +1589,7 @@ class EnhancedLinkedInJobHarvester:
         """
         for selector in selectors:
             try:
-                found_element = element.select_one(selector)
+                found_element = _css(selector).select_one(element)
                 if found_element:
                     text = found_element.get_text(strip=True)
                     if text and len(text) >= 2:
@@ -1128,7 +1619,7 @@ class EnhancedLinkedInJobHarvester:
         
         for selector in url_selectors:
             try:
-                link_element = element.select_one(selector)
+                link_element = _css(selector).select_one(element)
                 if link_element and link_element.get('href'):
                     href = link_element.get('href')
                     
@@ -1177,7 +1668,7 @@ class EnhancedLinkedInJobHarvester:
         
         # Extract job insights
         if self.config.extract_job_insights:
-            insights_elements = element.select('li.job-search-card__job-insight')
+            insights_elements = _css('li.job-search-card__job-insight').select(element)
             if insights_elements:
                 insights = [insight.get_text(strip=True) for insight in insights_elements]
                 metadata['job_insights'] = [insight for insight in insights if insight]
@@ -1256,10 +1747,10 @@ class EnhancedLinkedInJobHarvester:
             return ""
         
         # Remove extra whitespace and normalize
-        cleaned = re.sub(r'\s+', ' ', text.strip())
+        cleaned = self.WHITESPACE_PATTERN.sub(' ', text.strip())
         
         # Remove common LinkedIn artifacts
-        cleaned = re.sub(r'\b(new|hiring|actively recruiting)\s*$', '', cleaned, flags=re.IGNORECASE)
+        cleaned = self.TRAILING_ARTIFACT_PATTERN.sub('', cleaned)
         
         # Remove emoji and special characters if needed
         if len(cleaned) > self.config.maximum_job_title_length:
@@ -1288,24 +1779,19 @@ class EnhancedLinkedInJobHarvester:
         
         # Spam detection
         if self.config.spam_detection_enabled:
-            spam_indicators = [
-                '🚀', '💰', '🔥', '💯', 'URGENT', 'IMMEDIATE', 'HURRY',
-                'MAKE MONEY FAST', 'WORK FROM HOME GUARANTEED'
-            ]
-            title_upper = title.upper()
-            if any(indicator in title_upper for indicator in spam_indicators):
+            if self.SPAM_TITLE_PATTERN.search(title.upper()):
                 return False
         
         # Validate company name
         if job_data.get('company'):
             company = job_data['company'].strip()
-            if len(company) < 2 or not re.search(r'[a-zA-Z]', company):
+            if len(company) < 2 or not self.LETTER_PATTERN.search(company):
                 job_data['company'] = None
         
         # Validate location
         if job_data.get('location'):
             location = job_data['location'].strip()
-            if len(location) < 2 or not re.search(r'[a-zA-Z]', location):
+            if len(location) < 2 or not self.LETTER_PATTERN.search(location):
                 job_data['location'] = None
         
         return True
@@ -1340,6 +1826,38 @@ class EnhancedLinkedInJobHarvester:
         
         return min(1.0, base_score + bonus)
     
+    def _flatten_job_fields(self, job: Dict) -> Dict:
+        """
+        Convert list and dictionary fields to strings for tabular output.
+        
+        The job is only copied when a field actually needs converting.
+        
+        Args:
+            job: Harvested job data
+        
+        Returns:
+            Job data with flat field values
+        """
+        row = job
+        
+        # Handle list fields
+        for field in ('job_insights', 'job_requirements'):
+            value = job.get(field)
+            if isinstance(value, list):
+                if row is job:
+                    row = job.copy()
+                row[field] = '; '.join(str(item) for item in value)
+        
+        # Handle dictionary fields
+        for field in ('structured_salary', 'structured_company', 'structured_location', 'job_criteria'):
+            value = job.get(field)
+            if isinstance(value, dict):
+                if row is job:
+                    row = job.copy()
+                row[field] = json.dumps(value, ensure_ascii=False)
+        
+        return row
+    
     def save_harvested_data_to_csv(self, filename: str = "linkedin_jobs_harvested.csv") -> bool:
         """
         Save harvested jobs to CSV file with comprehensive metadata.
@@ -1357,57 +1875,11 @@ class EnhancedLinkedInJobHarvester:
         try:
             file_path = self.output_directory / filename
             
-            # Define comprehensive fieldnames including enhanced extraction
-            fieldnames = [
-                # Core job information
-                'title', 'company', 'location', 'posted_date', 'job_url',
-                
-                # Basic metadata
-                'salary_info', 'applicant_count', 'job_insights',
-                
-                # Enhanced extraction fields
-                'job_description', 'job_requirements', 'job_responsibilities',
-                'benefits_info', 'company_culture', 'enhanced_salary_info',
-                'enhanced_applicant_count', 'application_type', 'job_urgency',
-                'experience_level', 'employment_type', 'remote_work_option',
-                
-                # Company intelligence
-                'company_size', 'company_industry', 'company_logo_url',
-                'company_headquarters', 'company_website',
-                
-                # Structured data from JSON-LD
-                'structured_title', 'structured_description', 'structured_salary',
-                'structured_company', 'structured_location', 'structured_employment_type',
-                'structured_work_location', 'full_job_description', 'job_criteria',
-                
-                # System metadata
-                'harvested_at', 'harvester_version', 'data_source_region',
-                'extraction_method', 'data_quality_score'
-            ]
-            
             with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                # Keys outside the known columns are dropped by the writer itself
+                writer = csv.DictWriter(csvfile, fieldnames=self.TABULAR_FIELDNAMES, extrasaction='ignore')
                 writer.writeheader()
-                
-                for job in self.harvested_jobs_data:
-                    # Handle complex data types for CSV compatibility
-                    job_copy = job.copy()
-                    
-                    # Handle list fields
-                    list_fields = ['job_insights', 'job_requirements']
-                    for field in list_fields:
-                        if isinstance(job_copy.get(field), list):
-                            job_copy[field] = '; '.join(str(item) for item in job_copy[field])
-                    
-                    # Handle dictionary fields
-                    dict_fields = ['structured_salary', 'structured_company', 'structured_location', 'job_criteria']
-                    for field in dict_fields:
-                        if isinstance(job_copy.get(field), dict):
-                            job_copy[field] = json.dumps(job_copy[field], ensure_ascii=False)
-                    
-                    # Filter to fieldnames only
-                    filtered_job = {k: v for k, v in job_copy.items() if k in fieldnames}
-                    writer.writerow(filtered_job)
+                writer.writerows(self._flatten_job_fields(job) for job in self.harvested_jobs_data)
             
             logger.info(f"Saved {len(self.harvested_jobs_data)} jobs to {file_path}")
             return True
@@ -1441,14 +1913,19 @@ class EnhancedLinkedInJobHarvester:
                     'harvest_completed_at': datetime.now().isoformat(),
                     'target_region': self.region,
                     'domain_used': self.base_domain,
+                    'from_cache': self.results_from_cache,
                     'extraction_statistics': dict(self.extraction_statistics),
                     'quality_summary': self._generate_quality_summary()
                 },
                 'harvested_jobs': self.harvested_jobs_data
             }
             
-            with open(file_path, 'w', encoding='utf-8') as jsonfile:
-                json.dump(output_data, jsonfile, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(file_path, 'wb') as jsonfile:
+                    jsonfile.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(file_path, 'w', encoding='utf-8') as jsonfile:
+                    json.dump(output_data, jsonfile, indent=2, ensure_ascii=False)
             
             logger.info(f"Saved {len(self.harvested_jobs_data)} jobs to {file_path}")
             return True
@@ -1457,6 +1934,102 @@ class EnhancedLinkedInJobHarvester:
             logger.error(f"Error saving JSON: {str(e)}")
             return False
     
+    def save_harvested_data_to_arrow(self, filename: str = "linkedin_jobs_harvested.arrow",
+                                     compression: str = "zstd") -> bool:
+        """
+        Save harvested jobs to an Arrow IPC (Feather v2) file.
+        
+        Requires the optional pyarrow package. Company and location columns
+        are dictionary-encoded since their values repeat heavily.
+        
+        Args:
+            filename: Name of the output Arrow file
+            compression: Feather compression codec ('zstd', 'lz4' or 'uncompressed')
+        
+        Returns:
+            True if save was successful, False otherwise
+        """
+        if not self.harvested_jobs_data:
+            logger.warning("No harvested data to save")
+            return False
+        
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            import pyarrow.feather as feather
+        except ImportError:
+            logger.warning("pyarrow is not installed; skipping Arrow output")
+            return False
+        
+        try:
+            file_path = self.output_directory / filename
+            
+            rows = [self._flatten_job_fields(job) for job in self.harvested_jobs_data]
+            
+            # Columns come from every job, not just the first; known columns
+            # keep the CSV order and any others follow in first-seen order
+            present_keys = dict.fromkeys(key for row in rows for key in row)
+            column_names = [name for name in self.TABULAR_FIELDNAMES if name in present_keys]
+            column_names += [name for name in present_keys if name not in column_names]
+            
+            columns = []
+            for name in column_names:
+                values = [row.get(name) for row in rows]
+                try:
+                    columns.append(pa.array(values))
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    # Mixed value types across jobs; store the column as text
+                    columns.append(pa.array(
+                        [None if value is None else str(value) for value in values],
+                        type=pa.string()
+                    ))
+            table = pa.Table.from_arrays(columns, names=column_names)
+            
+            for column_name in ('company', 'location'):
+                index = table.schema.get_field_index(column_name)
+                if index != -1 and pa.types.is_string(table.schema.field(index).type):
+                    table = table.set_column(index, column_name, pc.dictionary_encode(table[column_name]))
+            
+            feather.write_feather(table, file_path, compression=compression, chunksize=65536)
+            
+            logger.info(f"Saved {len(self.harvested_jobs_data)} jobs to {file_path}")
+            return True
+        
+        except Exception as e:
+            logger.error(f"Error saving Arrow: {str(e)}")
+            return False
+    
+    def _start_stream_output(self):
+        """Create or truncate the incremental JSON Lines output file."""
+        file_path = self.output_directory / self.config.stream_output_filename
+        
+        try:
+            open(file_path, 'wb').close()
+        except Exception as e:
+            logger.error(f"Error starting stream output {file_path}: {str(e)}")
+    
+    def _append_jobs_to_stream(self, jobs: List[Dict]):
+        """
+        Append jobs to the incremental JSON Lines output file.
+        
+        Jobs reach disk page by page, so a long or interrupted harvest keeps
+        everything extracted so far.
+        
+        Args:
+            jobs: Newly extracted job dictionaries
+        """
+        file_path = self.output_directory / self.config.stream_output_filename
+        
+        try:
+            with open(file_path, 'ab') as stream_file:
+                for job in jobs:
+                    if orjson is not None:
+                        stream_file.write(orjson.dumps(job, option=orjson.OPT_APPEND_NEWLINE))
+                    else:
+                        stream_file.write((json.dumps(job, ensure_ascii=False) + '\n').encode('utf-8'))
+        except Exception as e:
+            logger.error(f"Error streaming jobs to {file_path}: {str(e)}")
+    
     def _generate_quality_summary(self) -> Dict:
         """
         Generate comprehensive quality summary of harvested data.
@@ -1468,19 +2041,33 @@ class EnhancedLinkedInJobHarvester:
             return {}
         
         total_jobs = len(self.harvested_jobs_data)
-        quality_scores = [job.get('data_quality_score', 0) for job in self.harvested_jobs_data]
+        completion_fields = ('title', 'company', 'location', 'job_url', 'salary_info')
+        completed_counts = dict.fromkeys(completion_fields, 0)
+        score_total = 0
+        high_quality = medium_quality = low_quality = 0
+        
+        # Single pass over the jobs for scores, quality buckets and completion
+        for job in self.harvested_jobs_data:
+            score = job.get('data_quality_score', 0)
+            score_total += score
+            if score >= 0.8:
+                high_quality += 1
+            elif score >= 0.5:
+                medium_quality += 1
+            else:
+                low_quality += 1
+            
+            for field in completion_fields:
+                if job.get(field):
+                    completed_counts[field] += 1
         
         return {
-            'average_quality_score': sum(quality_scores) / len(quality_scores),
-            'high_quality_jobs': sum(1 for score in quality_scores if score >= 0.8),
-            'medium_quality_jobs': sum(1 for score in quality_scores if 0.5 <= score < 0.8),
-            'low_quality_jobs': sum(1 for score in quality_scores if score < 0.5),
+            'average_quality_score': score_total / total_jobs,
+            'high_quality_jobs': high_quality,
+            'medium_quality_jobs': medium_quality,
+            'low_quality_jobs': low_quality,
             'completion_rates': {
-                'title': sum(1 for job in self.harvested_jobs_data if job.get('title')) / total_jobs,
-                'company': sum(1 for job in self.harvested_jobs_data if job.get('company')) / total_jobs,
-                'location': sum(1 for job in self.harvested_jobs_data if job.get('location')) / total_jobs,
-                'job_url': sum(1 for job in self.harvested_jobs_data if job.get('job_url')) / total_jobs,
-                'salary_info': sum(1 for job in self.harvested_jobs_data if job.get('salary_info')) / total_jobs,
+                field: count / total_jobs for field, count in completed_counts.items()
             }
         }
     
@@ -1492,50 +2079,64 @@ class EnhancedLinkedInJobHarvester:
         
         total_jobs = len(self.harvested_jobs_data)
         quality_summary = self._generate_quality_summary()
+        lines = []
         
-        print("=" * 80)
-        print("LinkedIn Job Harvester - Comprehensive Summary")
-        print("=" * 80)
+        lines.append("=" * 80)
+        lines.append("LinkedIn Job Harvester - Comprehensive Summary")
+        lines.append("=" * 80)
         
-        print(f"Total jobs harvested: {total_jobs}")
-        print(f"Target region: {self.region}")
-        print(f"Average quality score: {quality_summary.get('average_quality_score', 0):.3f}")
+        lines.append(f"Total jobs harvested: {total_jobs}")
+        lines.append(f"Target region: {self.region}")
+        if self.results_from_cache:
+            lines.append("Source: cached results (no extraction statistics for this run)")
+        lines.append(f"Average quality score: {quality_summary.get('average_quality_score', 0):.3f}")
         
         # Quality distribution
-        print(f"\nQuality Distribution:")
-        print(f"  High quality (≥0.8): {quality_summary.get('high_quality_jobs', 0)} "
-              f"({quality_summary.get('high_quality_jobs', 0)/total_jobs*100:.1f}%)")
-        print(f"  Medium quality (0.5-0.8): {quality_summary.get('medium_quality_jobs', 0)} "
-              f"({quality_summary.get('medium_quality_jobs', 0)/total_jobs*100:.1f}%)")
-        print(f"  Low quality (<0.5): {quality_summary.get('low_quality_jobs', 0)} "
-              f"({quality_summary.get('low_quality_jobs', 0)/total_jobs*100:.1f}%)")
+        lines.append(f"\nQuality Distribution:")
+        lines.append(f"  High quality (≥0.8): {quality_summary.get('high_quality_jobs', 0)} "
+                     f"({quality_summary.get('high_quality_jobs', 0)/total_jobs*100:.1f}%)")
+        lines.append(f"  Medium quality (0.5-0.8): {quality_summary.get('medium_quality_jobs', 0)} "
+                     f"({quality_summary.get('medium_quality_jobs', 0)/total_jobs*100:.1f}%)")
+        lines.append(f"  Low quality (<0.5): {quality_summary.get('low_quality_jobs', 0)} "
+                     f"({quality_summary.get('low_quality_jobs', 0)/total_jobs*100:.1f}%)")
         
         # Field completion rates
-        print(f"\nField Completion Rates:")
+        lines.append(f"\nField Completion Rates:")
         completion_rates = quality_summary.get('completion_rates', {})
         for field, rate in completion_rates.items():
-            print(f"  {field.title()}: {rate*100:.1f}%")
-        
-        # Top companies and locations
-        companies = [job.get('company') for job in self.harvested_jobs_data if job.get('company')]
-        if companies:
-            print(f"\nTop 5 Companies:")
-            for company, count in Counter(companies).most_common(5):
-                print(f"  {company}: {count}")
-        
-        locations = [job.get('location') for job in self.harvested_jobs_data if job.get('location')]
-        if locations:
-            print(f"\nTop 5 Locations:")
-            for location, count in Counter(locations).most_common(5):
-                print(f"  {location}: {count}")
+            lines.append(f"  {field.title()}: {rate*100:.1f}%")
+        
+        # Top companies and locations, counted in one pass
+        company_counts = Counter()
+        location_counts = Counter()
+        for job in self.harvested_jobs_data:
+            company = job.get('company')
+            if company:
+                company_counts[company] += 1
+            location = job.get('location')
+            if location:
+                location_counts[location] += 1
+        
+        if company_counts:
+            lines.append(f"\nTop 5 Companies:")
+            for company, count in company_counts.most_common(5):
+                lines.append(f"  {company}: {count}")
+        
+        if location_counts:
+            lines.append(f"\nTop 5 Locations:")
+            for location, count in location_counts.most_common(5):
+                lines.append(f"  {location}: {count}")
         
         # Extraction statistics
         if self.extraction_statistics:
-            print(f"\nExtraction Statistics:")
+            lines.append(f"\nExtraction Statistics:")
             for stat, value in self.extraction_statistics.items():
-                print(f"  {stat.replace('_', ' ').title()}: {value}")
+                lines.append(f"  {stat.replace('_', ' ').title()}: {value}")
+        
+        lines.append("\n" + "=" * 80)
         
-        print("\n" + "=" * 80)
+        # Emit the whole report in a single write
+        print("\n".join(lines))
     
     def _extract_detailed_job_information(self, job_card, job_url: Optional[str]) -> Dict:
         """
@@ -1605,7 +2206,7 @@ class EnhancedLinkedInJobHarvester:
         """
         for selector in self.DETAILED_EXTRACTION_SELECTORS['application_type']:
             try:
-                app_element = element.select_one(selector)
+                app_element = _css(selector).select_one(element)
                 if app_element:
                     # Check for Easy Apply indicators
                     if 'easy-apply' in app_element.get('class', []) or \
@@ -1631,7 +2232,7 @@ class EnhancedLinkedInJobHarvester:
         
         for selector in self.DETAILED_EXTRACTION_SELECTORS['job_requirements']:
             try:
-                req_elements = element.select(selector)
+                req_elements = _css(selector).select(element)
                 if req_elements:
                     for req_element in req_elements:
                         # Extract list items
@@ -1681,7 +2282,7 @@ class EnhancedLinkedInJobHarvester:
             company_data['company_industry'] = industry
         
         # Extract company logo URL
-        logo_elements = element.select(self.DETAILED_EXTRACTION_SELECTORS['company_logo'][0])
+        logo_elements = _css(self.DETAILED_EXTRACTION_SELECTORS['company_logo'][0]).select(element)
         if logo_elements:
             try:
                 logo_url = logo_elements[0].get('src') or logo_elements[0].get('data-src')
@@ -1698,7 +2299,7 @@ class EnhancedLinkedInJobHarvester:
             company_data['company_headquarters'] = headquarters
         
         # Extract company website
-        website_elements = element.select(self.DETAILED_EXTRACTION_SELECTORS['company_website'][0])
+        website_elements = _css(self.DETAILED_EXTRACTION_SELECTORS['company_website'][0]).select(element)
         if website_elements:
             try:
                 website_url = website_elements[0].get('href')
@@ -1728,7 +2329,7 @@ class EnhancedLinkedInJobHarvester:
             
             response = await self.http_client.get(job_url)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = BeautifulSoup(response.text, HTML_PARSER)
                 
                 detailed_data = {}
                 
@@ -1736,7 +2337,10 @@ class EnhancedLinkedInJobHarvester:
                 json_scripts = soup.find_all('script', type='application/ld+json')
                 for script in json_scripts:
                     try:
-                        json_data = json.loads(script.string)
+                        if orjson is not None:
+                            json_data = orjson.loads(script.string)
+                        else:
+                            json_data = json.loads(script.string)
                         if json_data.get('@type') == 'JobPosting':
                             detailed_data.update(self._parse_json_ld_job_data(json_data))
                             break
@@ -1751,13 +2355,13 @@ class EnhancedLinkedInJobHarvester:
                     detailed_data['full_job_description'] = job_desc
                 
                 # Extract job criteria from individual page
-                criteria_elements = soup.select('.description__job-criteria-list li')
+                criteria_elements = _css('.description__job-criteria-list li').select(soup)
                 if criteria_elements:
                     criteria = {}
                     for criterion in criteria_elements:
                         try:
-                            header = criterion.select_one('.description__job-criteria-subheader')
-                            text = criterion.select_one('.description__job-criteria-text')
+                            header = _css('.description__job-criteria-subheader').select_one(criterion)
+                            text = _css('.description__job-criteria-text').select_one(criterion)
                             if header and text:
                                 criteria[header.get_text(strip=True)] = text.get_text(strip=True)
                         except Exception:
@@ -1831,12 +2435,17 @@ class LinkedInJobScraper:
         Args:
             output_dir: Directory for saving output files
         """
+        configure_logging()
+        
         self.output_dir = output_dir
         self.jobs_data = []
+        self.from_cache = False
         self.harvester = None
+        self._harvester_lock = threading.Lock()
     
     def search_jobs(self, keywords: str = "", location: str = "", max_pages: int = 5, 
-                   delay_range: Tuple[float, float] = (3, 8), **kwargs) -> List[Dict]:
+                   delay_range: Tuple[float, float] = (3, 8), max_concurrency: int = 3,
+                   **kwargs) -> List[Dict]:
         """
         Search for jobs using the enhanced harvester (backward compatible).
         
@@ -1845,21 +2454,25 @@ class LinkedInJobScraper:
             location: Target location
             max_pages: Maximum pages to scrape
             delay_range: Delay range (maintained for compatibility)
+            max_concurrency: Maximum number of pages fetched at once
             **kwargs: Additional search parameters
             
         Returns:
             List of job data dictionaries
         """
-        return asyncio.run(self._async_search(keywords, location, max_pages, **kwargs))
+        return _run_async(self.search_jobs_async(keywords, location, max_pages,
+                                                  max_concurrency=max_concurrency, **kwargs))
     
-    async def _async_search(self, keywords: str, location: str, max_pages: int, **kwargs) -> List[Dict]:
+    async def search_jobs_async(self, keywords: str = "", location: str = "", max_pages: int = 5,
+                                max_concurrency: int = 3, **kwargs) -> List[Dict]:
         """
-        Async implementation of job search.
+        Search for jobs from within a running event loop.
         
         Args:
             keywords: Job search keywords
             location: Target location
             max_pages: Maximum pages to scrape
+            max_concurrency: Maximum number of pages fetched at once
             **kwargs: Additional search parameters
             
         Returns:
@@ -1869,33 +2482,69 @@ class LinkedInJobScraper:
         config = HarvestingConfiguration(
             minimum_request_delay=3.0,
             maximum_request_delay=8.0,
-            max_requests_per_session=75
+            max_requests_per_session=75,
+            concurrent_request_limit=max_concurrency
         )
         
         # Use enhanced harvester
         async with EnhancedLinkedInJobHarvester(self.output_dir, config) as harvester:
             jobs = await harvester.harvest_jobs(keywords, location, max_pages, **kwargs)
             self.jobs_data = jobs
+            self.from_cache = False
             self.harvester = harvester
             return jobs
     
+    def use_cached_jobs(self, jobs: List[Dict]):
+        """
+        Use previously cached search results instead of searching.
+        
+        Saved files and summaries are marked as coming from the cache, since
+        no extraction statistics exist for these jobs.
+        
+        Args:
+            jobs: Cached job data dictionaries
+        """
+        with self._harvester_lock:
+            self.jobs_data = jobs
+            self.from_cache = True
+            # Statistics from an earlier search do not describe these jobs
+            self.harvester = None
+    
+    def _output_harvester(self) -> EnhancedLinkedInJobHarvester:
+        """
+        Get a harvester holding the current jobs for saving and summaries.
+        
+        Reuses the harvester from the last search (keeping its extraction
+        statistics), and only builds one when jobs were set directly. Safe to
+        call from concurrent save threads; at most one harvester is built.
+        """
+        with self._harvester_lock:
+            if self.harvester is None:
+                self.harvester = EnhancedLinkedInJobHarvester(self.output_dir)
+            self.harvester.harvested_jobs_data = self.jobs_data
+            self.harvester.results_from_cache = self.from_cache
+            return self.harvester
+    
     def save_to_csv(self, filename: str = "linkedin_jobs_2025.csv") -> bool:
         """Save jobs to CSV file."""
         if not self.jobs_data:
             return False
         
-        harvester = EnhancedLinkedInJobHarvester(self.output_dir)
-        harvester.harvested_jobs_data = self.jobs_data
-        return harvester.save_harvested_data_to_csv(filename)
+        return self._output_harvester().save_harvested_data_to_csv(filename)
     
     def save_to_json(self, filename: str = "linkedin_jobs_2025.json") -> bool:
         """Save jobs to JSON file."""
         if not self.jobs_data:
             return False
         
-        harvester = EnhancedLinkedInJobHarvester(self.output_dir)
-        harvester.harvested_jobs_data = self.jobs_data
-        return harvester.save_harvested_data_to_json(filename)
+        return self._output_harvester().save_harvested_data_to_json(filename)
+    
+    def save_to_arrow(self, filename: str = "linkedin_jobs_2025.arrow", compression: str = "zstd") -> bool:
+        """Save jobs to Arrow IPC file (requires pyarrow)."""
+        if not self.jobs_data:
+            return False
+        
+        return self._output_harvester().save_harvested_data_to_arrow(filename, compression)
     
     def print_summary(self):
         """Print job harvesting summary."""
@@ -1903,12 +2552,12 @@ class LinkedInJobScraper:
             print("No job data available")
             return
         
-        harvester = EnhancedLinkedInJobHarvester(self.output_dir)
-        harvester.harvested_jobs_data = self.jobs_data
-        harvester.display_comprehensive_summary()
+        self._output_harvester().display_comprehensive_summary()
 
 
 if __name__ == "__main__":
+    configure_logging()
+    
     async def test_enhanced_harvester():
         """Test the enhanced job harvester with multiple scenarios."""
         print("Testing Enhanced LinkedIn Job Harvester")
@@ -1947,4 +2596,4 @@ if __name__ == "__main__":
                     print("No jobs found")
     
     # Run the test
-    asyncio.run(test_enhanced_harvester())
\ No newline at end of file
+    _run_async(test_enhanced_harvester())
\ No newline at end of file
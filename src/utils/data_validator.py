@@ -1,30 +1,47 @@
-from typing import Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
 import re
 from urllib.parse import urlparse
-import pandas as pd
 from datetime import datetime, timedelta
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class JobDataValidator:
     """
     Validates and cleans job data to ensure quality and consistency.
     """
     
-    def __init__(self):
+    _LETTER_RE = re.compile(r'[a-zA-Z]')
+    _WHITESPACE_RE = re.compile(r'\s+')
+    _RELATIVE_DATE_RE = re.compile(r'\b(day|week|month|year|hour|minute)s?\s+ago\b')
+    _PAREN_REMOTE_SUFFIX_RE = re.compile(r'\s*\(\s*remote\s*\)\s*$', re.IGNORECASE)
+    _DASH_REMOTE_SUFFIX_RE = re.compile(r'\s*-\s*remote\s*$', re.IGNORECASE)
+    
+    def __init__(self, min_title_length: int = 3, max_title_length: int = 200):
+        """
+        Initialize the validator.
+        
+        Args:
+            min_title_length (int): Shortest acceptable job title
+            max_title_length (int): Longest acceptable job title
+        """
+        self.min_title_length = min_title_length
+        self.max_title_length = max_title_length
         self.required_fields = {'title', 'company'}
         self.optional_fields = {'location', 'posted_date', 'job_url', 'summary', 'scraped_at', 'source'}
         self.valid_domains = {'linkedin.com', 'www.linkedin.com'}
         
         # Patterns for cleaning and validation
         self.company_noise_patterns = [
-            r'\s*\(.*?\)\s*$',  # Remove parenthetical info at end
-            r'\s*-\s*hiring\s*now\s*$',  # Remove "- hiring now"
-            r'\s*\|\s*.*$',  # Remove everything after |
+            re.compile(r'\s*\(.*?\)\s*$', re.IGNORECASE),  # Remove parenthetical info at end
+            re.compile(r'\s*-\s*hiring\s*now\s*$', re.IGNORECASE),  # Remove "- hiring now"
+            re.compile(r'\s*\|\s*.*$', re.IGNORECASE),  # Remove everything after |
         ]
         
         self.location_patterns = [
-            r'^([^,]+),?\s*([A-Z]{2}).*$',  # Extract city, state
-            r'^([^,]+),?\s*([A-Za-z\s]+)$',  # Extract city, country/region
+            re.compile(r'^([^,]+),?\s*([A-Z]{2}).*$'),  # Extract city, state
+            re.compile(r'^([^,]+),?\s*([A-Za-z\s]+)$'),  # Extract city, country/region
         ]
     
     def is_valid_job(self, job_data: Dict) -> bool:
@@ -37,11 +54,15 @@ class JobDataValidator:
         Returns:
             bool: True if job is valid, False otherwise
         """
-        if not job_data.get('title'):
+        title = job_data.get('title')
+        if not title:
+            return False
+        
+        title = str(title).strip()
+        if not self.min_title_length <= len(title) <= self.max_title_length:
             return False
         
-        title = str(job_data['title']).strip()
-        if len(title) < 3 or not re.search(r'[a-zA-Z]', title):
+        if not self._LETTER_RE.search(title):
             return False
         
         return True
@@ -100,14 +121,14 @@ class JobDataValidator:
         
         title = title.strip()
         
-        if len(title) < 3:
-            errors.append("Title too short (minimum 3 characters)")
+        if len(title) < self.min_title_length:
+            errors.append(f"Title too short (minimum {self.min_title_length} characters)")
         
-        if len(title) > 200:
-            errors.append("Title too long (maximum 200 characters)")
+        if len(title) > self.max_title_length:
+            errors.append(f"Title too long (maximum {self.max_title_length} characters)")
         
         # Check for suspicious patterns
-        if re.search(r'^[^a-zA-Z]*$', title):
+        if not self._LETTER_RE.search(title):
             errors.append("Title contains no letters")
         
         return errors
@@ -206,7 +227,7 @@ class JobDataValidator:
         
         if not parsed_date:
             # Try relative dates (e.g., "2 days ago")
-            if not re.search(r'\b(day|week|month|year|hour|minute)s?\s+ago\b', posted_date.lower()):
+            if not self._RELATIVE_DATE_RE.search(posted_date.lower()):
                 errors.append(f"Unable to parse posted date: {posted_date}")
         else:
             # Check if date is reasonable (not in future, not too old)
@@ -258,11 +279,11 @@ class JobDataValidator:
             return "N/A"
         
         # Remove excessive whitespace
-        title = re.sub(r'\s+', ' ', title.strip())
+        title = self._WHITESPACE_RE.sub(' ', title.strip())
         
         # Remove common noise
-        title = re.sub(r'\s*\(\s*remote\s*\)\s*$', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'\s*-\s*remote\s*$', '', title, flags=re.IGNORECASE)
+        title = self._PAREN_REMOTE_SUFFIX_RE.sub('', title)
+        title = self._DASH_REMOTE_SUFFIX_RE.sub('', title)
         
         return title.strip()
     
@@ -272,11 +293,11 @@ class JobDataValidator:
             return "N/A"
         
         # Remove excessive whitespace
-        company = re.sub(r'\s+', ' ', company.strip())
+        company = self._WHITESPACE_RE.sub(' ', company.strip())
         
         # Apply noise removal patterns
         for pattern in self.company_noise_patterns:
-            company = re.sub(pattern, '', company, flags=re.IGNORECASE)
+            company = pattern.sub('', company)
         
         return company.strip()
     
@@ -286,11 +307,11 @@ class JobDataValidator:
             return "N/A"
         
         # Remove excessive whitespace
-        location = re.sub(r'\s+', ' ', location.strip())
+        location = self._WHITESPACE_RE.sub(' ', location.strip())
         
         # Standardize common location formats
         for pattern in self.location_patterns:
-            match = re.match(pattern, location)
+            match = pattern.match(location)
             if match:
                 city, region = match.groups()
                 return f"{city.strip()}, {region.strip()}"
@@ -303,7 +324,7 @@ class JobDataValidator:
             return "N/A"
         
         # Remove excessive whitespace and newlines
-        summary = re.sub(r'\s+', ' ', summary.strip())
+        summary = self._WHITESPACE_RE.sub(' ', summary.strip())
         
         # Limit length
         if len(summary) > 500:
@@ -356,7 +377,7 @@ class JobDataValidator:
             company = job.get('company', '').lower().strip()
             location = job.get('location', '').lower().strip()
             
-            signature = f"{title}|{company}|{location}"
+            signature = (title, company, location)
             
             if signature not in seen_signatures:
                 seen_signatures.add(signature)
@@ -364,7 +385,7 @@ class JobDataValidator:
         
         return unique_jobs
     
-    def validate_dataframe(self, df: pd.DataFrame) -> tuple[pd.DataFrame, List[str]]:
+    def validate_dataframe(self, df: "pd.DataFrame") -> "tuple[pd.DataFrame, List[str]]":
         """
         Validate and clean a pandas DataFrame of job data.
         
@@ -374,6 +395,8 @@ class JobDataValidator:
         Returns:
             tuple: (cleaned_dataframe, list_of_errors)
         """
+        import pandas as pd
+        
         all_errors = []
         cleaned_data = []
         
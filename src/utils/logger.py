@@ -1,5 +1,6 @@
 import logging
 import logging.handlers
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import os
@@ -65,10 +66,13 @@ def setup_logger(
     return logger
 
 
+@lru_cache(maxsize=4)
 def get_scraper_logger(scraper_type: str = "basic") -> logging.Logger:
     """
     Get a pre-configured logger for scraper operations.
     
+    Loggers are cached per scraper type so handlers are only set up once.
+    
     Args:
         scraper_type (str): Type of scraper ('basic' or 'selenium')
         
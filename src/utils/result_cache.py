@@ -0,0 +1,80 @@
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON serialization
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class SearchResultCache:
+    """
+    File-backed cache of scraped job lists, keyed by search parameters.
+    
+    Repeating a search within the TTL returns the stored jobs instead of
+    hitting LinkedIn again.
+    """
+    
+    def __init__(self, cache_dir: str = "cache", ttl_seconds: int = 3600):
+        """
+        Initialize the cache.
+        
+        Args:
+            cache_dir (str): Directory for cache files
+            ttl_seconds (int): Maximum age of a usable cache entry
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+    
+    def _entry_path(self, params: Dict) -> Path:
+        """Map search parameters to a stable cache file path."""
+        key = json.dumps(params, sort_keys=True, ensure_ascii=False)
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"search_{digest}.json"
+    
+    def get(self, params: Dict) -> Optional[List[Dict]]:
+        """
+        Look up cached results for a search.
+        
+        Args:
+            params (Dict): Search parameters
+        
+        Returns:
+            Optional[List[Dict]]: Cached jobs, or None if missing or expired
+        """
+        path = self._entry_path(params)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return None
+            if orjson is not None:
+                return orjson.loads(path.read_bytes())
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def set(self, params: Dict, results: List[Dict]) -> None:
+        """
+        Store results for a search.
+        
+        Args:
+            params (Dict): Search parameters
+            results (List[Dict]): Jobs returned by the scraper
+        """
+        path = self._entry_path(params)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if orjson is not None:
+                path.write_bytes(orjson.dumps(results))
+            else:
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(results, f, ensure_ascii=False)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not write search cache {path}: {e}")
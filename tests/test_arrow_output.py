@@ -0,0 +1,33 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from scrapers.linkedin_scraper import EnhancedLinkedInJobHarvester
+
+feather = pytest.importorskip("pyarrow.feather")
+
+
+def test_arrow_output_keeps_fields_missing_from_first_job(tmp_path):
+    harvester = EnhancedLinkedInJobHarvester(str(tmp_path))
+    harvester.harvested_jobs_data = [
+        {'title': 'Python Developer', 'company': 'Acme'},
+        {'title': 'Data Engineer', 'company': 'Acme', 'salary_info': '$120k',
+         'job_insights': ['Full-time', 'Remote']},
+        {'title': 'ML Engineer', 'applicant_count': 42, 'custom_field': 'x'},
+        {'title': 'Backend Engineer', 'applicant_count': 'Over 200 applicants'},
+    ]
+    
+    assert harvester.save_harvested_data_to_arrow("jobs.arrow")
+    
+    table = feather.read_table(tmp_path / "jobs.arrow")
+    assert table.column_names == [
+        'title', 'company', 'salary_info', 'applicant_count', 'job_insights', 'custom_field'
+    ]
+    assert table.num_rows == 4
+    assert table['salary_info'].to_pylist() == [None, '$120k', None, None]
+    assert table['job_insights'].to_pylist() == [None, 'Full-time; Remote', None, None]
+    assert table['applicant_count'].to_pylist() == [None, None, '42', 'Over 200 applicants']
+    assert table['company'].to_pylist() == ['Acme', 'Acme', None, None]
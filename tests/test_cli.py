@@ -0,0 +1,45 @@
+import argparse
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main
+
+
+def _manager(max_pages_basic: int):
+    # Stands in for ScraperManager without loading config or creating directories
+    return SimpleNamespace(config=SimpleNamespace(scraping=SimpleNamespace(max_pages_basic=max_pages_basic)))
+
+
+@pytest.mark.parametrize('value, expected', [('1', 1), ('7', 7), ('010', 10)])
+def test_positive_int_accepts_whole_numbers(value, expected):
+    assert main._positive_int(value) == expected
+
+
+@pytest.mark.parametrize('value', ['0', '-1', '2.5', 'abc', '', ' 3'])
+def test_positive_int_rejects_other_values(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        main._positive_int(value)
+
+
+def test_parser_rejects_non_positive_max_pages(capsys):
+    with pytest.raises(SystemExit):
+        main.create_parser().parse_args(['-k', 'python', '-p', '0'])
+    assert '--max-pages' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('max_pages, in_range', [(0, False), (1, True), (10, True), (11, False)])
+def test_max_pages_range_check(capsys, max_pages, in_range):
+    manager = _manager(10)
+    
+    assert main.ScraperManager._max_pages_in_range(manager, max_pages) is in_range
+    assert bool(capsys.readouterr().out) is not in_range
+
+
+@pytest.mark.parametrize('max_pages_basic, expected', [(10, 3), (2, 2), (1, 1)])
+def test_default_max_pages_respects_limit(max_pages_basic, expected):
+    assert main.ScraperManager._default_max_pages(_manager(max_pages_basic)) == expected
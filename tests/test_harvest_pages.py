@@ -0,0 +1,106 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from scrapers.linkedin_scraper import EnhancedLinkedInJobHarvester, HarvestingConfiguration
+
+
+def _response(url: str, text: str) -> httpx.Response:
+    return httpx.Response(200, text=text, request=httpx.Request('GET', url))
+
+
+def _job(job_id: str, query: str = '') -> dict:
+    return {'title': f'Developer {job_id}', 'job_url': f'https://www.linkedin.com/jobs/view/{job_id}{query}'}
+
+
+@pytest.fixture
+def harvester(tmp_path):
+    return EnhancedLinkedInJobHarvester(str(tmp_path))
+
+
+@pytest.fixture
+def streaming_harvester(tmp_path):
+    config = HarvestingConfiguration(stream_output_filename='jobs.jsonl')
+    return EnhancedLinkedInJobHarvester(str(tmp_path), config)
+
+
+@pytest.mark.parametrize('url, text', [
+    ('https://www.linkedin.com/authwall?trk=guest_jobs', '<html><body>Join now</body></html>'),
+    ('https://www.linkedin.com/checkpoint/challenge/AgH', '<html><body>Security check</body></html>'),
+    ('https://www.linkedin.com/jobs/search?keywords=python',
+     '<html><head><link rel="canonical" href="https://www.linkedin.com/authwall"></head></html>'),
+])
+def test_block_pages_are_detected(harvester, url, text):
+    assert harvester._is_block_page(_response(url, text))
+
+
+def test_results_page_is_not_a_block_page(harvester):
+    # Markers past the sniffed head (e.g. in a footer link) are ignored
+    filler = ' ' * EnhancedLinkedInJobHarvester.BLOCK_PAGE_SNIFF_LENGTH
+    text = f'<html><body><div class="base-card">Python Developer</div>{filler}<a href="/authwall">Sign in</a></body></html>'
+    
+    assert not harvester._is_block_page(_response('https://www.linkedin.com/jobs/search?keywords=python', text))
+
+
+def test_url_dedup_ignores_query_string(harvester):
+    harvester._merge_page_jobs([_job('1', '?trk=page0'), _job('2')], 0)
+    harvester._merge_page_jobs([_job('1', '?trk=page1&refId=abc'), _job('3')], 1)
+    
+    assert [job['job_url'] for job in harvester.harvested_jobs_data] == [
+        'https://www.linkedin.com/jobs/view/1?trk=page0',
+        'https://www.linkedin.com/jobs/view/2',
+        'https://www.linkedin.com/jobs/view/3',
+    ]
+    assert harvester.extraction_statistics['duplicate_jobs_skipped'] == 1
+    assert harvester.extraction_statistics['successful_extractions'] == 3
+    assert harvester.extraction_statistics['failed_extractions'] == 1
+
+
+def test_jobs_without_url_are_kept(harvester):
+    harvester._merge_page_jobs([{'title': 'No URL'}, {'title': 'No URL'}], 0)
+    
+    assert len(harvester.harvested_jobs_data) == 2
+
+
+def _streamed(harvester):
+    path = harvester.output_directory / harvester.config.stream_output_filename
+    return [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+
+def test_stream_appends_each_page(streaming_harvester):
+    streaming_harvester._start_stream_output()
+    streaming_harvester._merge_page_jobs([_job('1'), _job('2')], 0)
+    streaming_harvester._merge_page_jobs([_job('2', '?trk=x'), _job('3')], 0)
+    
+    assert [job['title'] for job in _streamed(streaming_harvester)] == [
+        'Developer 1', 'Developer 2', 'Developer 3'
+    ]
+
+
+def test_harvest_truncates_previous_stream(streaming_harvester, monkeypatch):
+    stream_path = streaming_harvester.output_directory / 'jobs.jsonl'
+    stream_path.write_text(json.dumps(_job('old')) + '\n', encoding='utf-8')
+    
+    real_sleep = asyncio.sleep
+    
+    async def no_sleep(delay, *args, **kwargs):
+        await real_sleep(0)
+    
+    monkeypatch.setattr(asyncio, 'sleep', no_sleep)
+    
+    async def harvest():
+        streaming_harvester.http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(404))
+        )
+        async with streaming_harvester:
+            await streaming_harvester.harvest_jobs('python developer', 'Remote', 1)
+    
+    asyncio.run(harvest())
+    
+    assert stream_path.read_text(encoding='utf-8') == ''
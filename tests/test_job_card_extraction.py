@@ -0,0 +1,95 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from scrapers.linkedin_scraper import EnhancedLinkedInJobHarvester
+
+# Opening tag matching each job card selector, in ADVANCED_SELECTORS order
+CARD_TAGS = {
+    'div.job-search-card': ('<div class="job-search-card">', '</div>'),
+    'div.base-card': ('<div class="base-card relative">', '</div>'),
+    'li.result-card': ('<ul><li class="result-card">', '</li></ul>'),
+    'div.jobs-search-results__list-item': ('<div class="jobs-search-results__list-item">', '</div>'),
+    'div[data-entity-urn*="jobPosting"]': ('<div data-entity-urn="urn:li:jobPosting:123">', '</div>'),
+    'li[data-occludable-job-id]': ('<ul><li data-occludable-job-id="123">', '</li></ul>'),
+    'div.scaffold-layout__list-item': ('<div class="scaffold-layout__list-item">', '</div>'),
+    'article.job-card': ('<article class="job-card">', '</article>'),
+    '.job-result-card': ('<section class="job-result-card">', '</section>'),
+    '[data-job-id]': ('<div data-job-id="123">', '</div>'),
+}
+
+CARD_BODY = '''
+  <h3 class="base-search-card__title"><a href="/jobs/view/123?trk=public_jobs">Senior Python Developer</a></h3>
+  <h4 class="base-search-card__subtitle"><a href="/company/acme">Acme Corp</a></h4>
+  <div class="base-search-card__metadata">
+    <span class="job-search-card__location">Remote, US</span>
+    <span class="job-search-card__salary-info">$120,000 - $150,000</span>
+    <time datetime="2025-01-05">2 days ago</time>
+  </div>
+  <ul><li class="job-search-card__job-insight">Full-time</li></ul>
+'''
+
+# Markup outside any card that would match field selectors if it were kept
+PAGE_NOISE = '''
+<head><title>Jobs</title><script>var h3 = "<h3><a href='/jobs/view/999'>Fake</a></h3>";</script></head>
+<nav><h3><a href="/jobs/view/999">Navigation Jobs Link</a></h3></nav>
+'''
+
+
+def _page(card_selector: str) -> str:
+    opening, closing = CARD_TAGS[card_selector]
+    return (f'<html>{PAGE_NOISE}<body><main>{opening}{CARD_BODY}{closing}</main>'
+            f'<footer><span class="job-search-card__location">Footer</span></footer></body></html>')
+
+
+def _without_timestamps(jobs):
+    return [{key: value for key, value in job.items() if key != 'harvested_at'} for job in jobs]
+
+
+@pytest.fixture
+def harvester(tmp_path):
+    return EnhancedLinkedInJobHarvester(str(tmp_path))
+
+
+def test_every_card_selector_has_a_fixture():
+    assert list(CARD_TAGS) == list(EnhancedLinkedInJobHarvester.ADVANCED_SELECTORS['job_cards'])
+
+
+@pytest.mark.parametrize('card_selector', list(CARD_TAGS))
+def test_strained_parse_keeps_card_and_fields(harvester, card_selector):
+    page = _page(card_selector)
+    
+    result = harvester._extract_jobs_from_page(page)
+    
+    assert result is not None
+    jobs, failed = result
+    assert failed == 0
+    assert len(jobs) == 1
+    job = jobs[0]
+    assert job['title'] == 'Senior Python Developer'
+    assert job['company'] == 'Acme Corp'
+    assert job['location'] == 'Remote, US'
+    assert job['job_url'] == 'https://www.linkedin.com/jobs/view/123?trk=public_jobs'
+    assert job['posted_date'] == '2025-01-05'
+    assert job['salary_info'] == '$120,000 - $150,000'
+    assert job['job_insights'] == ['Full-time']
+
+
+@pytest.mark.parametrize('card_selector', list(CARD_TAGS))
+def test_strained_parse_matches_full_parse(harvester, monkeypatch, card_selector):
+    page = _page(card_selector)
+    strained_jobs, _ = harvester._extract_jobs_from_page(page)
+    
+    monkeypatch.setattr(harvester, 'JOB_CARD_STRAINER', None)
+    full_jobs, _ = harvester._extract_jobs_from_page(page)
+    
+    assert _without_timestamps(strained_jobs) == _without_timestamps(full_jobs)
+
+
+def test_page_without_cards_returns_none(harvester):
+    page = f'<html>{PAGE_NOISE}<body><p>No matching jobs found.</p></body></html>'
+    
+    assert harvester._extract_jobs_from_page(page) is None
@@ -0,0 +1,86 @@
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import scrapers.linkedin_scraper as linkedin_scraper
+from scrapers.linkedin_scraper import TokenBucketRateLimiter
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Virtual clock: sleeping advances time instantly."""
+    clock = SimpleNamespace(now=1000.0)
+    real_sleep = asyncio.sleep
+    
+    async def fake_sleep(delay, *args, **kwargs):
+        clock.now += max(0.0, delay)
+        await real_sleep(0)
+    
+    monkeypatch.setattr(linkedin_scraper, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return clock
+
+
+def _admission_times(limiter, clock, requests, cost=1.0):
+    async def run():
+        admitted = []
+        
+        async def request():
+            await limiter.acquire(cost)
+            admitted.append(clock.now)
+        
+        await asyncio.gather(*(request() for _ in range(requests)))
+        return admitted
+    
+    return asyncio.run(run())
+
+
+def test_minimum_gap_holds_for_concurrent_callers(fake_clock):
+    limiter = TokenBucketRateLimiter(capacity=3, refill_rate=10.0, min_interval=2.0)
+    
+    admitted = _admission_times(limiter, fake_clock, 5)
+    
+    # Plenty of tokens, so only the minimum gap paces requests, the first
+    # one included
+    assert admitted == pytest.approx([1002.0, 1004.0, 1006.0, 1008.0, 1010.0])
+
+
+def test_refill_rate_bounds_rate_once_capacity_is_spent(fake_clock):
+    limiter = TokenBucketRateLimiter(capacity=2, refill_rate=0.5)
+    
+    admitted = _admission_times(limiter, fake_clock, 4)
+    
+    # Two saved tokens go out at once, then one token every two seconds
+    assert admitted == pytest.approx([1000.0, 1000.0, 1002.0, 1004.0])
+
+
+def test_tokens_never_exceed_capacity(fake_clock):
+    limiter = TokenBucketRateLimiter(capacity=2, refill_rate=1.0)
+    fake_clock.now += 60.0
+    
+    admitted = _admission_times(limiter, fake_clock, 3)
+    
+    # A long idle period only refills up to capacity
+    assert admitted == pytest.approx([1060.0, 1060.0, 1061.0])
+
+
+def test_cost_above_capacity_leaves_bucket_in_debt(fake_clock):
+    limiter = TokenBucketRateLimiter(capacity=1, refill_rate=1.0)
+    
+    admitted = _admission_times(limiter, fake_clock, 2, cost=2.0)
+    
+    # The first request waits for one missing token and leaves the bucket at
+    # -1, so the next one needs three more seconds of refill
+    assert admitted == pytest.approx([1001.0, 1004.0])
+
+
+def test_rejects_invalid_parameters():
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(capacity=0, refill_rate=1.0)
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(capacity=1, refill_rate=1.0, min_interval=-1.0)
@@ -0,0 +1,50 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from utils.result_cache import SearchResultCache
+
+PARAMS = {'keywords': 'python developer', 'location': 'Remote', 'max_pages': 2}
+JOBS = [{'title': 'Python Developer', 'company': 'Acme', 'job_insights': ['Full-time']}]
+
+
+def test_round_trip(tmp_path):
+    cache = SearchResultCache(str(tmp_path / "cache"))
+    
+    assert cache.get(PARAMS) is None
+    cache.set(PARAMS, JOBS)
+    assert cache.get(PARAMS) == JOBS
+
+
+def test_key_ignores_parameter_order(tmp_path):
+    cache = SearchResultCache(str(tmp_path))
+    reordered = dict(reversed(list(PARAMS.items())))
+    
+    cache.set(PARAMS, JOBS)
+    
+    assert cache._entry_path(reordered) == cache._entry_path(PARAMS)
+    assert cache.get(reordered) == JOBS
+    assert cache.get({**PARAMS, 'max_pages': 3}) is None
+
+
+def test_expired_entry_is_a_miss(tmp_path):
+    cache = SearchResultCache(str(tmp_path), ttl_seconds=60)
+    cache.set(PARAMS, JOBS)
+    
+    path = cache._entry_path(PARAMS)
+    stale = time.time() - 61
+    os.utime(path, (stale, stale))
+    
+    assert cache.get(PARAMS) is None
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = SearchResultCache(str(tmp_path))
+    cache.set(PARAMS, JOBS)
+    
+    cache._entry_path(PARAMS).write_bytes(b'{"truncated": [')
+    
+    assert cache.get(PARAMS) is None